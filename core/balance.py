@@ -9,6 +9,8 @@ from utils.logger import setup_logger
 
 logger = setup_logger("balance")
 
+DEFAULT_BALANCE_CONCURRENCY = 16  # per-address fallback queries in flight (config: rpc_max_concurrency)
+
 
 async def check_balance(client: SubstrateClient, ss58_address: str) -> dict:
     """
@@ -26,12 +28,34 @@ async def check_balance(client: SubstrateClient, ss58_address: str) -> dict:
 async def check_all_balances(
     client: SubstrateClient,
     addresses: list[str],
+    concurrency: int = DEFAULT_BALANCE_CONCURRENCY,
 ) -> list[dict]:
     """
-    Check balances for multiple addresses in parallel.
+    Check balances for multiple addresses.
+    Uses a single batched storage query; falls back to per-address queries
+    (at most `concurrency` in flight) if the batch call is unavailable.
     Returns list of {address, free_rao, free_tao}
     """
-    tasks = [check_balance(client, addr) for addr in addresses]
+    try:
+        free_map = await client.get_balances(addresses)
+        return [
+            {
+                "address": addr,
+                "free_rao": free_map.get(addr, 0),
+                "free_tao": rao_to_tao(free_map.get(addr, 0)),
+            }
+            for addr in addresses
+        ]
+    except Exception as e:
+        logger.warning(f"Batched balance query failed, falling back to per-address: {e}")
+
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(addr):
+        async with sem:
+            return await check_balance(client, addr)
+
+    tasks = [_one(addr) for addr in addresses]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     balances = []
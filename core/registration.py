@@ -4,9 +4,11 @@ Only burn registration — no PoW.
 Signed by COLDKEY (not hotkey).
 """
 
+import asyncio
 from typing import Optional
 from core.substrate_client import SubstrateClient, rao_to_tao, tao_to_rao
 from utils.logger import setup_logger
+from utils import rpc_cache
 
 logger = setup_logger("registration")
 
@@ -21,32 +23,31 @@ async def get_registration_info(
     """
     info = {"netuid": netuid}
 
+    # Burn cost, hyperparams and neuron counts are independent -> fetch in parallel
+    burn_rao, params, size = await asyncio.gather(
+        rpc_cache.burn_cost(client, netuid),
+        rpc_cache.subnet_hyperparams(client, netuid),
+        rpc_cache.subnet_size(client, netuid),
+        return_exceptions=True,
+    )
+
     # Burn cost via direct storage query
-    burn_rao = await client.get_burn_cost(netuid)
+    if isinstance(burn_rao, Exception):
+        logger.error(f"Failed to get burn cost for SN{netuid}: {burn_rao}")
+        burn_rao = 0
     info["burn_cost_rao"] = burn_rao
     info["burn_cost_tao"] = rao_to_tao(burn_rao)
 
     # Hyperparams for registration status
-    params = await client.get_subnet_hyperparams(netuid)
-    if params:
+    if params and not isinstance(params, Exception):
         info["registration_allowed"] = params.get("registration_allowed", True)
         info["max_regs_per_block"] = params.get("max_regs_per_block", 0)
     else:
         info["registration_allowed"] = True
 
-    # Neuron count via subnet_info_v2 (more reliable)
-    try:
-        result = await client.substrate.runtime_call(
-            api="SubnetInfoRuntimeApi",
-            method="get_subnet_info_v2",
-            params=[netuid],
-        )
-        sinfo = result.value if hasattr(result, "value") else result
-        if isinstance(sinfo, dict):
-            info["current_neurons"] = sinfo.get("subnetwork_n", 0)
-            info["max_neurons"] = sinfo.get("max_allowed_uids", 0)
-    except Exception:
-        pass
+    # Neuron count via SubnetworkN / MaxAllowedUids storage
+    if size and not isinstance(size, Exception):
+        info["current_neurons"], info["max_neurons"] = size
 
     return info
 
@@ -76,6 +77,34 @@ async def check_registration_status(
         return None
 
 
+async def _noop():
+    """Placeholder awaitable for a skipped pre-check."""
+    return None
+
+
+def _extract_uid(events) -> Optional[int]:
+    """
+    UID from the last NeuronRegistered event in a receipt, or None.
+    Events in one receipt share a shape, so it is detected once from the first.
+    """
+    if not events:
+        return None
+    if hasattr(events[0], "value"):
+        events = [event.value for event in events]
+
+    if isinstance(events[0], dict):
+        for ev in reversed(events):
+            if ev.get("event_id", "") == "NeuronRegistered":
+                attrs = ev.get("attributes", {})
+                return attrs.get("uid") or attrs.get(1)
+        return None
+
+    for ev in reversed(events):
+        if getattr(ev, "event_id", None) == "NeuronRegistered":
+            return getattr(ev, "uid", None)
+    return None
+
+
 async def burn_register(
     client: SubstrateClient,
     wallet,
@@ -83,6 +112,7 @@ async def burn_register(
     netuid: int,
     check_balance: bool = True,
     limit_price_tao: float = None,
+    known_unregistered: bool = False,
 ) -> tuple[bool, Optional[str], Optional[int]]:
     """
     Register a hotkey on a subnet via burn registration.
@@ -97,13 +127,19 @@ async def burn_register(
         check_balance: Pre-check if balance sufficient
         limit_price_tao: Max burn price in TAO. If set, uses register_limit
                          to reject if burn exceeds this price.
+        known_unregistered: Caller just checked the hotkey is not registered;
+                            skips the registration-status pre-check.
         
     Returns:
         (success, error_message, uid)
         uid is the assigned UID if registration succeeded
     """
-    # Pre-checks
-    burn_rao = await client.get_burn_cost(netuid)
+    # Pre-checks (independent reads, fetched together)
+    burn_rao, balance, existing_uid = await asyncio.gather(
+        rpc_cache.burn_cost(client, netuid),
+        rpc_cache.balance(client, wallet.coldkeypub.ss58_address) if check_balance else _noop(),
+        check_registration_status(client, hotkey_ss58, netuid) if not known_unregistered else _noop(),
+    )
     burn_tao = rao_to_tao(burn_rao)
     logger.info(f"Burn cost for SN{netuid}: {burn_tao:.9f} TAO")
 
@@ -114,17 +150,14 @@ async def burn_register(
             None,
         )
 
-    if check_balance:
-        balance = await client.get_balance(wallet.coldkeypub.ss58_address)
-        if balance < burn_rao:
-            return (
-                False,
-                f"Insufficient balance: {rao_to_tao(balance):.9f} TAO < {burn_tao:.9f} TAO burn cost",
-                None,
-            )
+    if check_balance and balance < burn_rao:
+        return (
+            False,
+            f"Insufficient balance: {rao_to_tao(balance):.9f} TAO < {burn_tao:.9f} TAO burn cost",
+            None,
+        )
 
     # Check if already registered
-    existing_uid = await check_registration_status(client, hotkey_ss58, netuid)
     if existing_uid is not None:
         return True, f"Already registered with UID {existing_uid}", existing_uid
 
@@ -156,20 +189,13 @@ async def burn_register(
             wait_for_inclusion=True,
         )
 
-        if await receipt.is_success:
-            # Try to get UID from events
+        success = await receipt.is_success
+
+        if success:
+            # Try to get UID from events (is_success already fetched and cached them)
             uid = None
             try:
-                events = await receipt.triggered_events
-                for event in events:
-                    ev = event.value if hasattr(event, "value") else event
-                    if isinstance(ev, dict):
-                        event_id = ev.get("event_id", "")
-                        if event_id == "NeuronRegistered":
-                            attrs = ev.get("attributes", {})
-                            uid = attrs.get("uid") or attrs.get(1)
-                    elif hasattr(ev, "event_id") and ev.event_id == "NeuronRegistered":
-                        uid = getattr(ev, "uid", None)
+                uid = _extract_uid(await receipt.triggered_events)
             except Exception:
                 pass  # Event parsing is best-effort, UID is queried as fallback
 
@@ -177,6 +203,8 @@ async def burn_register(
             if uid is None:
                 uid = await check_registration_status(client, hotkey_ss58, netuid)
 
+            # Burn cost rises after each registration
+            client.invalidate_cache()
             logger.info(f"Registration successful! UID: {uid}")
             return True, None, uid
         else:
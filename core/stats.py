@@ -5,42 +5,202 @@ Uses global neuron cache for fast registration lookups.
 """
 
 import asyncio
-from typing import Optional
-from core.substrate_client import SubstrateClient, rao_to_tao, decode_price, decode_bytes
+import logging
+import random
+import time
+from functools import lru_cache
+from operator import attrgetter
+from typing import NamedTuple, Optional
+from core.substrate_client import (
+    SubstrateClient, RAO_PER_TAO, SS58_FORMAT, rao_to_tao, decode_price, decode_bytes,
+)
 from utils.logger import setup_logger
+from utils import rpc_cache
 
 logger = setup_logger("stats")
 
-
-async def fetch_tao_price() -> Optional[float]:
-    """Fetch current TAO/USD price. Binance primary, CoinGecko fallback."""
+try:
+    from scalecodec.utils.ss58 import ss58_encode as _ss58_encode
+except ImportError:
     try:
+        from substrateinterface.utils.ss58 import ss58_encode as _ss58_encode
+    except ImportError:
+        _ss58_encode = None
+
+# orjson is optional: faster C parser for the price responses when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+PRICE_TTL = 30.0  # TAO/USD is reused across wallets within a stats scan
+PRICE_REFRESH_INTERVAL = 25.0  # background refresh, under PRICE_TTL so the last price stays fresh
+PRICE_REQUEST_TIMEOUT = 1.5  # per attempt; both providers are raced, so keep it short
+PRICE_ATTEMPTS = 2
+NEURON_FETCH_CONCURRENCY = 25  # get_neurons_lite calls in flight during the global scan
+NEURON_CACHE_TTL = 12.0  # ~2 blocks: repeated stats views reuse the last full scan
+
+
+# Shared HTTP session for price lookups (keep-alive across calls)
+_SESSION = None
+
+
+async def _http_session():
+    """
+    Lazily create the shared aiohttp session with a pooled connector.
+    No lock needed: creation does not await, so two callers cannot interleave here.
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
         import aiohttp
-        async with aiohttp.ClientSession() as session:
-            try:
-                url = "https://api.binance.com/api/v3/ticker/price?symbol=TAOUSDT"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        price = float(data.get("price", 0))
-                        if price > 0:
-                            return price
-            except Exception as e:
-                logger.warning(f"Binance price failed: {e}")
+        _SESSION = aiohttp.ClientSession(
+            # keepalive above PRICE_TTL so each refresh reuses the open TLS connection
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _SESSION
 
-            try:
-                url = "https://api.coingecko.com/api/v3/simple/price?ids=bittensor&vs_currencies=usd"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("bittensor", {}).get("usd")
-            except Exception as e:
-                logger.warning(f"CoinGecko price failed: {e}")
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session. Call once on shutdown."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
+async def _get_json(session, url: str) -> Optional[dict]:
+    """
+    GET a price endpoint with a short per-attempt timeout, retrying transient
+    failures (connection errors, timeouts, 429/5xx) with jittered backoff.
+    """
+    import aiohttp
+    timeout = aiohttp.ClientTimeout(total=PRICE_REQUEST_TIMEOUT)
+    for attempt in range(PRICE_ATTEMPTS):
+        try:
+            async with session.get(url, timeout=timeout) as resp:
+                if resp.status == 200:
+                    return await resp.json(loads=_json_loads)
+                if resp.status != 429 and resp.status < 500:
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == PRICE_ATTEMPTS - 1:
+                raise
+        await asyncio.sleep(min(0.5, 0.1 * 2 ** attempt) * (0.5 + random.random()))
+    return None
+
+
+async def _binance_price(session, log_level: int) -> Optional[float]:
+    try:
+        data = await _get_json(session, "https://api.binance.com/api/v3/ticker/price?symbol=TAOUSDT")
+        if data:
+            price = float(data.get("price", 0))
+            if price > 0:
+                return price
+    except Exception as e:
+        logger.log(log_level, f"Binance price failed: {e}")
+    return None
+
+
+async def _coingecko_price(session, log_level: int) -> Optional[float]:
+    try:
+        data = await _get_json(session, "https://api.coingecko.com/api/v3/simple/price?ids=bittensor&vs_currencies=usd")
+        if data:
+            return data.get("bittensor", {}).get("usd")
     except Exception as e:
-        logger.warning(f"Failed to fetch TAO price: {e}")
+        logger.log(log_level, f"CoinGecko price failed: {e}")
     return None
 
 
+async def _fetch_tao_price_uncached(log_level: int = logging.WARNING) -> Optional[float]:
+    """
+    Fetch current TAO/USD price. Queries Binance and CoinGecko concurrently, first valid wins.
+    Provider failures are logged at `log_level` (DEBUG from the background refresher).
+    """
+    try:
+        session = await _http_session()
+    except Exception as e:
+        logger.log(log_level, f"Failed to fetch TAO price: {e}")
+        return None
+
+    tasks = [
+        asyncio.ensure_future(_binance_price(session, log_level)),
+        asyncio.ensure_future(_coingecko_price(session, log_level)),
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            price = await next_done
+            if price:
+                return price
+    finally:
+        for t in tasks:
+            t.cancel()
+    return None
+
+
+async def fetch_tao_price() -> Optional[float]:
+    """
+    Current TAO/USD price, cached for PRICE_TTL seconds.
+    Concurrent callers share one HTTP request; failed lookups are not kept.
+    """
+    price = last_tao_price()
+    if price is not None:
+        return price
+    price = await rpc_cache.cached_call(("fetch_tao_price",), PRICE_TTL, _fetch_tao_price_uncached)
+    if price is None:
+        rpc_cache.invalidate("fetch_tao_price")
+    return price
+
+
+# Background refresher: keeps _LAST_PRICE warm so callers never wait on HTTP.
+# (monotonic fetch time, price): blocking prompts stall the refresher, so age is checked on read
+_LAST_PRICE: Optional[tuple[float, float]] = None
+_REFRESHER: Optional[asyncio.Task] = None
+
+
+async def _price_refresher(interval: float) -> None:
+    global _LAST_PRICE
+    while True:
+        try:
+            # DEBUG: the console handler would print provider warnings mid-menu
+            price = await _fetch_tao_price_uncached(logging.DEBUG)
+            if price:
+                _LAST_PRICE = (time.monotonic(), price)
+        except Exception as e:
+            logger.debug(f"Price refresh failed: {e}")
+        await asyncio.sleep(interval)
+
+
+def start_price_refresher(interval: float = PRICE_REFRESH_INTERVAL) -> None:
+    """Start refreshing the TAO price in the background. Call from inside the running loop."""
+    global _REFRESHER
+    if _REFRESHER is None or _REFRESHER.done():
+        _REFRESHER = asyncio.get_running_loop().create_task(_price_refresher(interval))
+
+
+async def stop_price_refresher() -> None:
+    """Stop the background refresher (if running) and forget the last price."""
+    global _REFRESHER, _LAST_PRICE
+    if _REFRESHER is not None:
+        _REFRESHER.cancel()
+        try:
+            await _REFRESHER
+        except asyncio.CancelledError:
+            pass
+    _REFRESHER = None
+    _LAST_PRICE = None
+
+
+def last_tao_price() -> Optional[float]:
+    """Last price from the background refresher if it is under PRICE_TTL old, else None."""
+    if _REFRESHER is None or _REFRESHER.done() or _LAST_PRICE is None:
+        return None
+    fetched_at, price = _LAST_PRICE
+    if time.monotonic() - fetched_at >= PRICE_TTL:
+        return None
+    return price
+
+
 def decode_ss58(raw) -> str:
     """Decode raw account bytes to SS58 address."""
     if isinstance(raw, str):
@@ -48,57 +208,105 @@ def decode_ss58(raw) -> str:
     if isinstance(raw, tuple) and len(raw) == 1 and isinstance(raw[0], tuple):
         raw = raw[0]
     if isinstance(raw, (tuple, list)) and len(raw) == 32:
-        try:
-            from scalecodec.utils.ss58 import ss58_encode
-            return ss58_encode(bytes(raw), 42)
-        except ImportError:
-            try:
-                from substrateinterface.utils.ss58 import ss58_encode
-                return ss58_encode(bytes(raw), 42)
-            except ImportError:
-                return "0x" + bytes(raw).hex()
+        return _encode_account(bytes(raw))
     return str(raw)
 
 
-async def build_global_neuron_cache(client: SubstrateClient) -> dict:
+# Sized for the global neuron cache: every hotkey on every subnet is decoded once
+@lru_cache(maxsize=65536)
+def _encode_account(account: bytes) -> str:
+    """SS58-encode 32 account bytes (memoized: the same hotkey shows up on many subnets)."""
+    if _ss58_encode is None:
+        return "0x" + account.hex()
+    return _ss58_encode(account, SS58_FORMAT)
+
+
+def decode_name(raw) -> str:
+    """Decode a chain byte string (subnet name, token symbol) to text."""
+    if isinstance(raw, tuple) and len(raw) == 1 and isinstance(raw[0], (tuple, list)):
+        raw = raw[0]
+    return decode_bytes(raw)
+
+
+class SubnetRow(NamedTuple):
+    """One (hotkey, subnet) position in get_wallet_stats()["subnets"]."""
+    netuid: int
+    subnet_name: str
+    hotkey: str
+    hotkey_name: str
+    uid: Optional[int]
+    alpha_stake: float
+    tao_value: float
+    emission: float  # TAO per block
+    incentive: int
+    is_registered: bool
+    moving_price: float
+
+
+class NeuronCache(dict):
+    """
+    {hotkey_ss58: [{netuid, uid, emission, ...}, ...]}, plus `by_pair`:
+    a flat {(hotkey_ss58, netuid): registration} index over the same dicts.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.by_pair: dict[tuple[str, int], dict] = {}
+
+
+@rpc_cache.async_ttl_cache(NEURON_CACHE_TTL)
+async def build_global_neuron_cache(client: SubstrateClient) -> NeuronCache:
     """
     Fetch neurons_lite from ALL subnets and build hotkey -> registrations map.
-    Returns: {hotkey_ss58: [{netuid, uid, emission, incentive, ...}, ...]}
+    Returns: NeuronCache {hotkey_ss58: [{netuid, uid, emission, incentive, ...}, ...]}
     Note: emission values are in alpha RAO per TEMPO (not per block).
+    Cached for NEURON_CACHE_TTL; concurrent callers share one scan. Treat as read-only.
     """
     netuids = await client.get_all_subnet_netuids()
     if not netuids:
-        return {}
+        return NeuronCache()
+
+    # Keep up to NEURON_FETCH_CONCURRENCY requests in flight at all times
+    # (fixed-size batches would stall on each batch's slowest subnet)
+    sem = asyncio.Semaphore(NEURON_FETCH_CONCURRENCY)
 
     async def fetch_neurons(netuid):
-        try:
-            result = await client.substrate.runtime_call(
-                api="NeuronInfoRuntimeApi",
-                method="get_neurons_lite",
-                params=[netuid],
-            )
-            data = result.value if hasattr(result, "value") else result
-            return netuid, data if isinstance(data, list) else []
-        except Exception:
-            return netuid, []
+        # Through the client so the rate limiter and transient-error retry apply
+        async with sem:
+            return netuid, await client.get_neurons_lite(netuid)
 
-    BATCH = 25
     all_neurons = {}
-    for i in range(0, len(netuids), BATCH):
-        batch = netuids[i:i+BATCH]
-        results = await asyncio.gather(*[fetch_neurons(n) for n in batch])
-        for netuid, neurons in results:
-            all_neurons[netuid] = neurons
-
-    hotkey_map = {}
-    for netuid, neurons in all_neurons.items():
-        for n in neurons:
-            if not isinstance(n, dict):
-                continue
-            hk = decode_ss58(n.get("hotkey", ""))
-            if hk not in hotkey_map:
-                hotkey_map[hk] = []
-            hotkey_map[hk].append({
+    for next_done in asyncio.as_completed([fetch_neurons(n) for n in netuids]):
+        netuid, neurons = await next_done
+        all_neurons[netuid] = neurons
+
+    hotkey_map = NeuronCache()
+    by_pair = hotkey_map.by_pair
+    # The same hotkey shows up on many subnets: decode each distinct raw key once,
+    # keyed on the payload itself so repeats skip the bytes() copy and LRU lookup
+    ss58_by_raw = {}
+    for netuid in netuids:  # netuid order, not completion order
+        for n in all_neurons[netuid]:
+            # Fast path: dict neuron with a hashable hotkey already seen on another subnet
+            try:
+                raw = n["hotkey"]
+                hk = ss58_by_raw[raw]
+            except (KeyError, TypeError):
+                if not isinstance(n, dict):
+                    continue
+                raw = n.get("hotkey", "")
+                if isinstance(raw, tuple) and len(raw) == 32:
+                    hk = _encode_account(bytes(raw))
+                else:
+                    hk = decode_ss58(raw)
+                try:
+                    ss58_by_raw[raw] = hk
+                except TypeError:  # unhashable payload (list)
+                    pass
+            registrations = hotkey_map.get(hk)
+            if registrations is None:
+                registrations = hotkey_map[hk] = []
+            registration = {
                 "netuid": netuid,
                 "uid": n.get("uid", 0),
                 "emission": n.get("emission", 0),
@@ -108,11 +316,63 @@ async def build_global_neuron_cache(client: SubstrateClient) -> dict:
                 "active": n.get("active", False),
                 "rank": n.get("rank", 0),
                 "validator_trust": n.get("validator_trust", 0),
-            })
+            }
+            registrations.append(registration)
+            by_pair[(hk, netuid)] = registration
 
     return hotkey_map
 
 
+# Last (dynamic list, tables) pair: wallets scanned with one shared_dynamic
+# reuse the same lookup tables instead of rebuilding them per wallet.
+# Holding the list keeps its id() from being reused by another object.
+_TABLES_CACHE: Optional[tuple] = None
+
+
+# Per-netuid row: (moving_price, value_factor, emission_factor, name or None)
+_NO_SUBNET = (0.0, 0.0, 0.0, None)
+
+
+def _subnet_tables(dynamic_raw: list) -> tuple:
+    """
+    Per-netuid lookup table from get_all_dynamic_info output: (table_size, subnet_info),
+    subnet_info[netuid] = (moving_price, value_factor, emission_factor, name or None).
+    Callers must treat the returned list as read-only.
+    """
+    global _TABLES_CACHE
+    if _TABLES_CACHE is not None and _TABLES_CACHE[0] is dynamic_raw:
+        return _TABLES_CACHE[1]
+
+    # Dense per-netuid table (netuids are small contiguous ints), so each row does
+    # one list index instead of hashing into several dicts:
+    #   moving_price:    TAO per alpha
+    #   value_factor:    alpha TAO -> TAO value (root is 1:1, unpriced subnets are 0)
+    #   emission_factor: alpha RAO per tempo -> TAO per block
+    dynamic = [info for info in dynamic_raw if isinstance(info, dict)]
+    table_size = max((info.get("netuid", 0) for info in dynamic), default=0) + 1
+    subnet_info = [_NO_SUBNET] * table_size
+    subnet_info[0] = (0.0, 1.0, 0.0, None)
+    for info in dynamic:
+        netuid = info.get("netuid", 0)
+        mp = decode_price(info.get("moving_price", 0))
+        tempo = info.get("tempo", 360)
+        if netuid == 0:
+            value_factor = 1.0
+        else:
+            value_factor = mp if mp > 0 else 0.0
+        emission_factor = mp / tempo / RAO_PER_TAO if mp > 0 and tempo > 0 else 0.0
+        identity = info.get("subnet_identity")
+        if identity and isinstance(identity, dict):
+            name_raw = identity.get("subnet_name", info.get("subnet_name", ()))
+        else:
+            name_raw = info.get("subnet_name", ())
+        subnet_info[netuid] = (mp, value_factor, emission_factor, decode_name(name_raw) if name_raw else None)
+
+    tables = (table_size, subnet_info)
+    _TABLES_CACHE = (dynamic_raw, tables)
+    return tables
+
+
 async def get_wallet_stats(
     client: SubstrateClient,
     coldkey_ss58: str,
@@ -127,154 +387,127 @@ async def get_wallet_stats(
     Get comprehensive wallet stats.
 
     Args:
-        neuron_cache: pre-built {hotkey -> [{netuid, uid, emission, ...}]} from build_global_neuron_cache()
-                      emission values are alpha RAO per tempo.
+        neuron_cache: pre-built NeuronCache {hotkey -> [{netuid, uid, emission, ...}]} from build_global_neuron_cache()
+                      emission values are alpha RAO per tempo. If omitted and hotkey_ss58_list
+                      is given, it is built concurrently with the wallet queries.
         hotkey_name_map: optional {hotkey_ss58: hotkey_name} for display purposes.
         shared_dynamic: pre-fetched dynamic info (avoids redundant RPC call per wallet).
         shared_price: pre-fetched TAO price (avoids redundant API call per wallet).
     """
     tasks = {
-        "balance": client.get_balance(coldkey_ss58),
+        "balance": rpc_cache.balance(client, coldkey_ss58),
         "stakes": client.get_stake_info_for_coldkey(coldkey_ss58),
     }
     # Only fetch dynamic/price if not pre-provided
     if shared_dynamic is None:
-        tasks["dynamic"] = client.get_all_dynamic_info()
+        tasks["dynamic"] = rpc_cache.all_dynamic_info(client)
     if shared_price is None and include_usd:
-        tasks["price"] = fetch_tao_price()
-
+        shared_price = last_tao_price()
+        if shared_price is None:
+            tasks["price"] = fetch_tao_price()
+    # No pre-built neuron cache: scan alongside the wallet queries instead of before them
+    if neuron_cache is None and hotkey_ss58_list:
+        tasks["neurons"] = build_global_neuron_cache(client)
+
+    # Parallel queries
+    values = await asyncio.gather(*tasks.values(), return_exceptions=True)
     results = {}
-    for key, task in tasks.items():
-        try:
-            results[key] = await task
-        except Exception as e:
-            logger.error(f"Failed to fetch {key}: {e}")
-            results[key] = None
+    failed = []
+    for key, value in zip(tasks, values):
+        if isinstance(value, Exception):
+            logger.error(f"Failed to fetch {key}: {value}")
+            failed.append(key)
+            value = None
+        results[key] = value
 
     # Use shared data if provided
     if shared_dynamic is not None:
         results["dynamic"] = shared_dynamic
     if shared_price is not None:
         results["price"] = shared_price
+    if "neurons" in tasks:
+        neuron_cache = results["neurons"]
 
-    price_map = {}
-    name_map = {}
-    tempo_map = {}
-    if results.get("dynamic"):
-        for info in results["dynamic"]:
-            if isinstance(info, dict):
-                netuid = info.get("netuid", 0)
-                price_map[netuid] = decode_price(info.get("moving_price", 0))
-                tempo_map[netuid] = info.get("tempo", 360)
-                identity = info.get("subnet_identity")
-                if identity and isinstance(identity, dict):
-                    name_raw = identity.get("subnet_name", info.get("subnet_name", ()))
-                else:
-                    name_raw = info.get("subnet_name", ())
-                name_map[netuid] = decode_bytes(name_raw) if name_raw else f"SN{netuid}"
+    table_size, subnet_info = _subnet_tables(results.get("dynamic") or [])
 
     subnets = []
     total_staked_tao = 0.0
     total_emission_tao_per_block = 0.0
-    seen_pairs = set()
     hk_name_map = hotkey_name_map or {}
 
-    stakes = results.get("stakes", []) or []
-    for entry in stakes:
-        if not isinstance(entry, dict):
-            continue
-
-        netuid = entry.get("netuid", 0)
-        hotkey = decode_ss58(entry.get("hotkey", ""))
-        alpha_stake_rao = entry.get("stake", 0)
-        alpha_tao = rao_to_tao(alpha_stake_rao)
-        moving_price = price_map.get(netuid, 0.0)
-        tempo = tempo_map.get(netuid, 360)
-
-        if netuid == 0:
-            tao_value = alpha_tao
-        elif moving_price > 0:
-            tao_value = alpha_tao * moving_price
-        else:
-            tao_value = 0.0
+    # (hotkey, netuid) -> registration; plain-dict caches get the index built here
+    pair_index = getattr(neuron_cache, "by_pair", None)
+    if pair_index is None:
+        pair_index = {
+            (hk, nd["netuid"]): nd
+            for hk, registrations in (neuron_cache or {}).items()
+            for nd in registrations
+        }
+
+    # (hotkey, netuid) -> stake entry, so registrations check "has a stake row?" in O(1)
+    stakes_by_pair = {
+        (decode_ss58(entry.get("hotkey", "")), entry.get("netuid", 0)): entry
+        for entry in results.get("stakes", []) or []
+        if isinstance(entry, dict)
+    }
 
+    def _pairs():
+        """
+        One stream of (hotkey, netuid, alpha_rao, neuron_data, is_own, chain_registered):
+        stake entries first, then our registered hotkeys with no stake (from neuron cache).
+        """
+        for pair, entry in stakes_by_pair.items():
+            hotkey, netuid = pair
+            yield (
+                hotkey, netuid, entry.get("stake", 0), pair_index.get(pair),
+                hotkey in hk_name_map, entry.get("is_registered", False),
+            )
+        if neuron_cache and hotkey_ss58_list:
+            for hk in dict.fromkeys(hotkey_ss58_list):
+                for nd in neuron_cache.get(hk, []):
+                    if (hk, nd["netuid"]) not in stakes_by_pair:
+                        yield hk, nd["netuid"], 0, nd, True, True
+
+    for hotkey, netuid, alpha_stake_rao, neuron_data, is_own_hotkey, chain_registered in _pairs():
+        moving_price, value_factor, emission_factor, subnet_name = (
+            subnet_info[netuid] if netuid < table_size else _NO_SUBNET
+        )
+        alpha_tao = alpha_stake_rao / RAO_PER_TAO
+        tao_value = alpha_tao * value_factor
         total_staked_tao += tao_value
 
-        # Lookup neuron data from cache for emission/uid
-        neuron_data = None
-        if neuron_cache:
-            for nd in neuron_cache.get(hotkey, []):
-                if nd["netuid"] == netuid:
-                    neuron_data = nd
-                    break
-
+        # Only count emission and registration for our own hotkeys
+        emission_tao_per_block = 0.0
         if neuron_data:
-            # emission is alpha RAO per tempo -> convert to TAO per block
-            emission_alpha_per_tempo = rao_to_tao(neuron_data["emission"])
-            emission_tao_per_tempo = emission_alpha_per_tempo * moving_price if moving_price > 0 else 0.0
-            emission_tao_per_block = emission_tao_per_tempo / tempo if tempo > 0 else 0.0
+            if is_own_hotkey:
+                # emission is alpha RAO per tempo -> convert to TAO per block
+                emission_tao_per_block = neuron_data["emission"] * emission_factor
             uid = neuron_data["uid"]
             incentive = neuron_data["incentive"]
-            is_registered = True
+            is_registered = is_own_hotkey
         else:
-            emission_tao_per_block = 0.0
             uid = None
             incentive = 0
-            is_registered = entry.get("is_registered", False)
-
-        # Only count emission and registration for our own hotkeys
-        is_own_hotkey = hotkey in hk_name_map
-        if not is_own_hotkey:
-            emission_tao_per_block = 0.0
-            is_registered = False
+            is_registered = is_own_hotkey and chain_registered
 
         total_emission_tao_per_block += emission_tao_per_block
-        seen_pairs.add((hotkey, netuid))
 
         if alpha_stake_rao > 0 or is_registered:
-            subnets.append({
-                "netuid": netuid,
-                "subnet_name": name_map.get(netuid, f"SN{netuid}"),
-                "hotkey": hotkey,
-                "hotkey_name": hk_name_map.get(hotkey, ""),
-                "uid": uid,
-                "alpha_stake": alpha_tao,
-                "tao_value": tao_value,
-                "emission": emission_tao_per_block,
-                "incentive": incentive,
-                "is_registered": is_registered,
-                "moving_price": moving_price,
-            })
-
-    # Add registered hotkeys with 0 stake (from neuron cache)
-    if neuron_cache and hotkey_ss58_list:
-        for hk in hotkey_ss58_list:
-            for nd in neuron_cache.get(hk, []):
-                netuid = nd["netuid"]
-                if (hk, netuid) in seen_pairs:
-                    continue
-                seen_pairs.add((hk, netuid))
-                mp = price_map.get(netuid, 0.0)
-                tempo = tempo_map.get(netuid, 360)
-                emission_alpha_per_tempo = rao_to_tao(nd["emission"])
-                emission_tao_per_tempo = emission_alpha_per_tempo * mp if mp > 0 else 0.0
-                emission_tao_per_block = emission_tao_per_tempo / tempo if tempo > 0 else 0.0
-                total_emission_tao_per_block += emission_tao_per_block
-                subnets.append({
-                    "netuid": netuid,
-                    "subnet_name": name_map.get(netuid, f"SN{netuid}"),
-                    "hotkey": hk,
-                    "hotkey_name": hk_name_map.get(hk, ""),
-                    "uid": nd["uid"],
-                    "alpha_stake": 0.0,
-                    "tao_value": 0.0,
-                    "emission": emission_tao_per_block,
-                    "incentive": nd["incentive"],
-                    "is_registered": True,
-                    "moving_price": mp,
-                })
-
-    subnets.sort(key=lambda x: x["netuid"])
+            subnets.append(SubnetRow(
+                netuid,
+                subnet_name or f"SN{netuid}",
+                hotkey,
+                hk_name_map.get(hotkey, ""),
+                uid,
+                alpha_tao,
+                tao_value,
+                emission_tao_per_block,
+                incentive,
+                is_registered,
+                moving_price,
+            ))
+
+    subnets.sort(key=attrgetter("netuid"))
 
     free_balance_tao = rao_to_tao(results.get("balance", 0) or 0)
     total_value_tao = free_balance_tao + total_staked_tao
@@ -291,6 +524,7 @@ async def get_wallet_stats(
         "total_value_usd": total_value_usd,
         "tao_price_usd": tao_price,
         "subnets": subnets,
+        "failed": failed,  # query keys that errored and were treated as empty
     }
 
 
@@ -299,31 +533,33 @@ async def get_subnet_overview(
     netuid: int,
 ) -> Optional[dict]:
     """Get overview info for a single subnet."""
-    info = await client.get_subnet_dynamic_info(netuid)
-    if not info:
+    info, burn_rao, params, size = await asyncio.gather(
+        client.get_subnet_dynamic_info(netuid),
+        rpc_cache.burn_cost(client, netuid),
+        rpc_cache.subnet_hyperparams(client, netuid),
+        rpc_cache.subnet_size(client, netuid),
+        return_exceptions=True,
+    )
+    if not info or isinstance(info, Exception):
         return None
 
-    burn_rao = await client.get_burn_cost(netuid)
-    params = await client.get_subnet_hyperparams(netuid)
+    if isinstance(burn_rao, Exception):
+        logger.error(f"Failed to get burn cost for SN{netuid}: {burn_rao}")
+        burn_rao = 0
+    if isinstance(params, Exception):
+        params = None
 
     sinfo = None
-    try:
-        result = await client.substrate.runtime_call(
-            api="SubnetInfoRuntimeApi",
-            method="get_subnet_info_v2",
-            params=[netuid],
-        )
-        sinfo = result.value if hasattr(result, "value") else result
-    except Exception:
-        pass
+    if size and not isinstance(size, Exception):
+        sinfo = {"subnetwork_n": size[0], "max_allowed_uids": size[1]}
 
     identity = info.get("subnet_identity")
     if identity and isinstance(identity, dict):
-        name = decode_bytes(identity.get("subnet_name", info.get("subnet_name", ())))
+        name = decode_name(identity.get("subnet_name", info.get("subnet_name", ())))
     else:
-        name = decode_bytes(info.get("subnet_name", ()))
+        name = decode_name(info.get("subnet_name", ()))
 
-    symbol = decode_bytes(info.get("token_symbol", ()))
+    symbol = decode_name(info.get("token_symbol", ()))
 
     overview = {
         "netuid": netuid,
@@ -4,27 +4,52 @@ No btcli dependency — uses async-substrate-interface directly.
 """
 
 import asyncio
+import random
+from functools import lru_cache
 from typing import Optional, Any
 from async_substrate_interface import AsyncSubstrateInterface
 from async_substrate_interface.substrate_addons import RetryAsyncSubstrate
 from utils.logger import setup_logger
+from utils import rpc_cache
+from utils.rate_limit import TokenBucket
+
+try:
+    from async_substrate_interface.errors import ConnectionClosed, MaxRetriesExceeded
+    _TRANSIENT_ERRORS = (asyncio.TimeoutError, ConnectionError, ConnectionClosed, MaxRetriesExceeded)
+except ImportError:
+    _TRANSIENT_ERRORS = (asyncio.TimeoutError, ConnectionError)
 
 logger = setup_logger("substrate_client")
 
 # Constants
 RAO_PER_TAO = 1_000_000_000  # 1 TAO = 1e9 RAO
+_TAO_PER_RAO = 1.0 / RAO_PER_TAO  # multiply instead of divide in per-row conversions
 SS58_FORMAT = 42  # Bittensor SS58 format
 I64F64_DIVISOR = 2**32  # I64F64 fixed-point: bits / 2^32 = real value
+QUERY_MULTI_CHUNK = 512  # storage keys per query_multi request
+DEFAULT_ERA = {"period": 64}  # mortal: an unincluded extrinsic expires after 64 blocks (~13 min)
+SUBMIT_CONCURRENCY = 20  # extrinsics from one account awaiting inclusion at once in submit_many
+INCLUSION_POLL_INTERVAL = 3.0  # seconds between chain-head checks while submit_many waits (~4 per block)
+UID_FALLBACK_CONCURRENCY = 32  # per-pair Uids queries in flight when query_multi fails
+# SelectiveMetagraph field indices for the pruning and epoch views
+# num_uids, max_uids, hotkeys, coldkeys, emission, block_at_registration,
+# immunity_period, block, owner_hotkey, owner_coldkey
+FIELDS_PRUNING = [30, 31, 52, 53, 60, 66, 36, 7, 5, 6]
+# validator_permit, hotkeys, coldkeys, tempo, block, last_step, num_uids
+FIELDS_EPOCH = [57, 52, 53, 8, 7, 9, 30]
+RPC_ATTEMPTS = 3  # tries per query/runtime_call on transient transport errors
+RPC_BACKOFF_BASE = 1.0  # seconds, doubled per retry
+RPC_BACKOFF_CAP = 30.0  # seconds
 
 
 def rao_to_tao(rao: int) -> float:
     """Convert RAO to TAO."""
-    return rao / RAO_PER_TAO
+    return rao * _TAO_PER_RAO
 
 
 def tao_to_rao(tao: float) -> int:
-    """Convert TAO to RAO."""
-    return int(tao * RAO_PER_TAO)
+    """Convert TAO to RAO (rounded: 4.35 * 1e9 is 4349999999.999999 in floats)."""
+    return int(tao * RAO_PER_TAO + 0.5)
 
 
 def decode_price(price_raw) -> float:
@@ -41,13 +66,45 @@ def decode_price(price_raw) -> float:
     return bits / I64F64_DIVISOR
 
 
+def _v(result):
+    """Unwrap a query/runtime-call result to its decoded value (plain values pass through)."""
+    return getattr(result, "value", result)
+
+
+async def _retry(coro_factory, attempts: int = RPC_ATTEMPTS):
+    """
+    Await coro_factory(), retrying transient transport errors with jittered
+    exponential backoff. Other errors (bad params, decode failures) raise at once.
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except _TRANSIENT_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(RPC_BACKOFF_CAP, RPC_BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * 0.5)
+            logger.debug(f"RPC attempt {attempt + 1} failed ({e!r}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+@lru_cache(maxsize=4096)
+def _decode_byte_tuple(data: tuple) -> str:
+    """Memoized tuple decode: names and symbols repeat across every stats/overview call."""
+    return bytes(data).decode("utf-8", errors="replace")
+
+
 def decode_bytes(data) -> str:
     """
     Decode byte tuple/list from chain into string.
     Chain returns tuples like (65, 112, 101, 120) for 'Apex'.
     """
-    if isinstance(data, (tuple, list)):
-        return bytes(data).decode("utf-8", errors="replace")
+    try:
+        if isinstance(data, tuple):
+            return _decode_byte_tuple(data)
+        if isinstance(data, list):
+            return _decode_byte_tuple(tuple(data))
+    except (TypeError, ValueError):
+        return ""  # not a byte sequence (values outside 0..255)
     if isinstance(data, bytes):
         return data.decode("utf-8", errors="replace")
     if isinstance(data, str):
@@ -70,11 +127,28 @@ class SubstrateClient:
             balance = await client.get_balance("5GrwvaEF...")
     """
 
-    def __init__(self, url: str = None, fallbacks: list[str] = None):
+    def __init__(
+        self,
+        url: str = None,
+        fallbacks: list[str] = None,
+        disk_cache: bool = False,
+        rate_limit: float = 0,
+        burst: int = 0,
+    ):
         self.url = url
         self.fallbacks = fallbacks or []
+        # Read requests per second to the node (0 = unlimited); writes are never throttled
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate_limit, burst or max(1, int(rate_limit * 2))) if rate_limit > 0 else None
+        )
+        # Persist runtime metadata / static query results on disk between runs
+        self.disk_cache = disk_cache
         self.substrate: Optional[AsyncSubstrateInterface] = None
         self._connected = False
+        # ss58 -> next nonce to use; seeded from chain, advanced locally per submission
+        self._nonces: dict[str, int] = {}
+        # Runtime constants, read once per connection
+        self._existential_deposit: Optional[int] = None
 
     async def connect(self, url: str = None, fallbacks: list[str] = None) -> None:
         """Connect to the chain."""
@@ -96,13 +170,22 @@ class SubstrateClient:
                 retry_timeout=30.0,
             )
         else:
-            self.substrate = AsyncSubstrateInterface(
+            substrate_cls = AsyncSubstrateInterface
+            if self.disk_cache:
+                try:
+                    from async_substrate_interface.async_substrate import DiskCachedAsyncSubstrateInterface
+                    substrate_cls = DiskCachedAsyncSubstrateInterface
+                except ImportError:
+                    logger.warning("Disk cache not supported by installed async-substrate-interface")
+            self.substrate = substrate_cls(
                 url=url,
                 ss58_format=SS58_FORMAT,
             )
 
         await self.substrate.initialize()
         self._connected = True
+        self._nonces.clear()
+        self._existential_deposit = None
 
         chain = self.substrate._chain
         logger.info(f"Connected to chain: {chain}")
@@ -126,6 +209,34 @@ class SubstrateClient:
         if not self._connected or not self.substrate:
             raise ConnectionError("Not connected. Call connect() first.")
 
+    async def _throttle(self) -> None:
+        """Wait for a rate-limiter token before a read request (no-op when unlimited)."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+    async def _query(self, module: str, storage_function: str, params: list, block_hash: Optional[str] = None):
+        """substrate.query with rate limiting and retry on transient errors."""
+        async def call():
+            await self._throttle()
+            return await self.substrate.query(
+                module=module, storage_function=storage_function, params=params, block_hash=block_hash,
+            )
+        return await _retry(call)
+
+    async def _query_multi(self, storage_keys: list):
+        """substrate.query_multi with rate limiting and retry on transient errors."""
+        async def call():
+            await self._throttle()
+            return await self.substrate.query_multi(storage_keys)
+        return await _retry(call)
+
+    async def _runtime_call(self, api: str, method: str, params: list):
+        """substrate.runtime_call with rate limiting and retry on transient errors."""
+        async def call():
+            await self._throttle()
+            return await self.substrate.runtime_call(api=api, method=method, params=params)
+        return await _retry(call)
+
     # ========================================================================
     # Balance queries
     # ========================================================================
@@ -133,7 +244,7 @@ class SubstrateClient:
     async def get_balance(self, ss58_address: str) -> int:
         """Get free balance in RAO for an address."""
         self._ensure_connected()
-        result = await self.substrate.query(
+        result = await self._query(
             module="System",
             storage_function="Account",
             params=[ss58_address],
@@ -141,44 +252,71 @@ class SubstrateClient:
         if result is None:
             return 0
         # result is dict-like: {"nonce": ..., "data": {"free": ..., "reserved": ..., ...}}
-        data = result.value if hasattr(result, "value") else result
+        data = _v(result)
         if isinstance(data, dict):
             return data.get("data", {}).get("free", 0)
         return 0
 
+    async def get_balances(self, ss58_addresses: list[str]) -> dict[str, int]:
+        """
+        Get free balances in RAO for many addresses, one query_multi per QUERY_MULTI_CHUNK addresses.
+        Returns: {ss58_address: free_rao}
+        """
+        self._ensure_connected()
+        balances = {addr: 0 for addr in ss58_addresses}
+        for i in range(0, len(ss58_addresses), QUERY_MULTI_CHUNK):
+            storage_keys = [
+                await self.substrate.create_storage_key("System", "Account", [addr])
+                for addr in ss58_addresses[i:i + QUERY_MULTI_CHUNK]
+            ]
+            for storage_key, value in await self._query_multi(storage_keys):
+                params = getattr(storage_key, "params", None)
+                if not params:
+                    continue
+                data = _v(value)
+                if isinstance(data, dict):
+                    balances[params[0]] = data.get("data", {}).get("free", 0)
+        return balances
+
     async def get_balance_tao(self, ss58_address: str) -> float:
         """Get free balance in TAO."""
         return rao_to_tao(await self.get_balance(ss58_address))
 
     async def get_existential_deposit(self) -> int:
-        """Get existential deposit (minimum balance) in RAO."""
+        """Get existential deposit (minimum balance) in RAO. Cached for the connection."""
         self._ensure_connected()
+        if self._existential_deposit is not None:
+            return self._existential_deposit
         result = await self.substrate.get_constant("Balances", "ExistentialDeposit")
         if result:
-            return result.value if hasattr(result, "value") else int(result)
+            self._existential_deposit = int(_v(result))
+            return self._existential_deposit
         return 500  # fallback default
 
     # ========================================================================
     # Stake info queries
     # ========================================================================
 
-    async def get_stake_info_for_coldkey(self, coldkey_ss58: str) -> list:
+    async def get_stake_info_for_coldkey(self, coldkey_ss58: str, strict: bool = False) -> list:
         """
         Get all stake info for a coldkey across all subnets.
         Returns list of StakeInfo dicts with: hotkey, coldkey, netuid, stake, 
         emission, tao_emission, is_registered, etc.
+        strict=True raises instead of returning [] on failure.
         """
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="StakeInfoRuntimeApi",
                 method="get_stake_info_for_coldkey",
                 params=[coldkey_ss58],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Failed to get stake info for {coldkey_ss58}: {e}")
+            if strict:
+                raise
             return []
 
     async def get_stake_for_hotkey_coldkey_netuid(
@@ -187,12 +325,12 @@ class SubstrateClient:
         """Get alpha stake amount for specific hotkey/coldkey/netuid combo. Returns RAO."""
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="StakeInfoRuntimeApi",
                 method="get_stake_info_for_hotkey_coldkey_netuid",
                 params=[hotkey_ss58, coldkey_ss58, netuid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             if data and isinstance(data, dict):
                 return data.get("stake", 0)
             return 0
@@ -208,15 +346,16 @@ class SubstrateClient:
         """Get list of all active subnet netuids."""
         self._ensure_connected()
         try:
+            await self._throttle()
             result = await self.substrate.query_map(
                 module="SubtensorModule",
                 storage_function="NetworksAdded",
             )
             netuids = []
             async for netuid, added in result:
-                val = added.value if hasattr(added, "value") else added
+                val = _v(added)
                 if val:
-                    uid = netuid.value if hasattr(netuid, "value") else netuid
+                    uid = _v(netuid)
                     netuids.append(int(uid))
             return sorted(netuids)
         except Exception as e:
@@ -228,79 +367,119 @@ class SubstrateClient:
         Get dynamic info for a subnet: prices, emissions, volume.
         Key fields: alpha_in, alpha_out, tao_in, moving_price, subnet_volume,
                     token_symbol, subnet_name, tempo
+        Served from the cached all-subnets list when it was fetched within the last block.
         """
         self._ensure_connected()
+        for info in rpc_cache.peek(("all_dynamic_info", self)) or ():
+            if isinstance(info, dict) and info.get("netuid") == netuid:
+                return info
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="SubnetInfoRuntimeApi",
                 method="get_dynamic_info",
                 params=[netuid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, dict) else None
         except Exception as e:
             logger.error(f"Failed to get dynamic info for subnet {netuid}: {e}")
             return None
 
-    async def get_all_dynamic_info(self) -> list:
-        """Get dynamic info for all subnets."""
+    async def get_all_dynamic_info(self, strict: bool = False) -> list:
+        """Get dynamic info for all subnets. strict=True raises instead of returning []."""
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="SubnetInfoRuntimeApi",
                 method="get_all_dynamic_info",
                 params=[],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Failed to get all dynamic info: {e}")
+            if strict:
+                raise
             return []
 
-    async def get_subnet_hyperparams(self, netuid: int) -> Optional[dict]:
-        """Get subnet hyperparameters including burn cost, registration status, etc."""
+    async def get_subnet_hyperparams(self, netuid: int, strict: bool = False) -> Optional[dict]:
+        """
+        Get subnet hyperparameters including burn cost, registration status, etc.
+        strict=True raises instead of returning None on failure.
+        """
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="SubnetInfoRuntimeApi",
                 method="get_subnet_hyperparams",
                 params=[netuid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, dict) else None
         except Exception as e:
             logger.error(f"Failed to get hyperparams for subnet {netuid}: {e}")
+            if strict:
+                raise
             return None
 
-    async def get_burn_cost(self, netuid: int) -> int:
-        """Get current burn registration cost in RAO for a subnet via direct storage query."""
+    async def get_burn_cost(self, netuid: int, strict: bool = False) -> int:
+        """
+        Get current burn registration cost in RAO for a subnet via direct storage query.
+        strict=True raises instead of returning 0 when both lookups fail.
+        """
         self._ensure_connected()
         try:
-            result = await self.substrate.query(
+            result = await self._query(
                 module="SubtensorModule",
                 storage_function="Burn",
                 params=[netuid],
             )
             if result is not None:
-                val = result.value if hasattr(result, "value") else result
+                val = _v(result)
                 return int(val) if val else 0
             return 0
         except Exception as e:
             logger.warning(f"Direct Burn query failed for SN{netuid}, trying subnet_info_v2: {e}")
             # Fallback: get_subnet_info_v2 also has burn field
             try:
-                result = await self.substrate.runtime_call(
+                result = await self._runtime_call(
                     api="SubnetInfoRuntimeApi",
                     method="get_subnet_info_v2",
                     params=[netuid],
                 )
-                data = result.value if hasattr(result, "value") else result
+                data = _v(result)
                 if isinstance(data, dict):
                     return int(data.get("burn", 0))
             except Exception:
                 pass
+            if strict:
+                raise
             return 0
 
+    async def get_subnet_size(self, netuid: int, strict: bool = False) -> Optional[tuple[int, int]]:
+        """
+        (registered neurons, max allowed UIDs) for a subnet.
+        Two small storage items in one query_multi, instead of the full get_subnet_info_v2 struct.
+        strict=True raises instead of returning None on failure.
+        """
+        self._ensure_connected()
+        try:
+            storage_keys = [
+                await self.substrate.create_storage_key("SubtensorModule", "SubnetworkN", [netuid]),
+                await self.substrate.create_storage_key("SubtensorModule", "MaxAllowedUids", [netuid]),
+            ]
+            results = await self._query_multi(storage_keys)
+            values = {}
+            for storage_key, value in results:
+                val = _v(value)
+                values[storage_key.storage_function] = int(val) if val else 0
+            return values.get("SubnetworkN", 0), values.get("MaxAllowedUids", 0)
+        except Exception as e:
+            logger.error(f"Failed to get subnet size for SN{netuid}: {e}")
+            if strict:
+                raise
+            return None
+
     # ========================================================================
     # Metagraph queries
     # ========================================================================
@@ -309,12 +488,12 @@ class SubstrateClient:
         """Get full metagraph for a subnet."""
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="SubnetInfoRuntimeApi",
                 method="get_metagraph",
                 params=[netuid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, dict) else None
         except Exception as e:
             logger.error(f"Failed to get metagraph for subnet {netuid}: {e}")
@@ -332,17 +511,27 @@ class SubstrateClient:
         """
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="SubnetInfoRuntimeApi",
                 method="get_selective_metagraph",
                 params=[netuid, field_indices],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, dict) else None
         except Exception as e:
             logger.error(f"Failed to get selective metagraph for subnet {netuid}: {e}")
             return None
 
+    async def get_metagraph_fields(self, netuid: int, field_indices: list[int]) -> Optional[dict]:
+        """
+        Selective metagraph for `field_indices`, falling back to the full
+        metagraph on runtimes without get_selective_metagraph.
+        """
+        data = await self.get_selective_metagraph(netuid, field_indices)
+        if data is None:
+            data = await self.get_metagraph(netuid)
+        return data
+
     # ========================================================================
     # Neuron info queries
     # ========================================================================
@@ -351,12 +540,12 @@ class SubstrateClient:
         """Get lite neuron info for all neurons on a subnet."""
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="NeuronInfoRuntimeApi",
                 method="get_neurons_lite",
                 params=[netuid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Failed to get neurons for subnet {netuid}: {e}")
@@ -366,12 +555,12 @@ class SubstrateClient:
         """Check if hotkey is registered on subnet via Uids storage. Returns uid or None."""
         self._ensure_connected()
         try:
-            result = await self.substrate.query(
+            result = await self._query(
                 module="SubtensorModule",
                 storage_function="Uids",
                 params=[netuid, hotkey_ss58],
             )
-            val = result.value if hasattr(result, "value") else result
+            val = _v(result)
             if val is not None:
                 return int(val)
             return None
@@ -387,16 +576,41 @@ class SubstrateClient:
         """
         self._ensure_connected()
         result_map = {hk: [] for hk in hotkey_ss58_list}
+        pairs = [(hk, netuid) for hk in hotkey_ss58_list for netuid in netuids]
 
-        tasks = []
-        task_keys = []
-        for hk in hotkey_ss58_list:
-            for netuid in netuids:
-                tasks.append(self.get_uid_for_hotkey_on_subnet(netuid, hk))
-                task_keys.append((hk, netuid))
+        try:
+            # Batched: one state_queryStorageAt per QUERY_MULTI_CHUNK keys
+            found = {}
+            for i in range(0, len(pairs), QUERY_MULTI_CHUNK):
+                chunk = pairs[i:i + QUERY_MULTI_CHUNK]
+                storage_keys = [
+                    await self.substrate.create_storage_key("SubtensorModule", "Uids", [netuid, hk])
+                    for hk, netuid in chunk
+                ]
+                for storage_key, value in await self._query_multi(storage_keys):
+                    val = _v(value)
+                    if val is not None:
+                        netuid, hk = storage_key.params
+                        found[(hk, int(netuid))] = int(val)
+            for hk, netuid in pairs:
+                uid = found.get((hk, netuid))
+                if uid is not None:
+                    result_map[hk].append((netuid, uid))
+            return result_map
+        except Exception as e:
+            logger.warning(f"Batched Uids query failed, falling back to per-pair queries: {e}")
+
+        # Bounded: thousands of simultaneous queries just get throttled by public RPCs
+        sem = asyncio.Semaphore(UID_FALLBACK_CONCURRENCY)
+
+        async def _bounded(hk: str, netuid: int):
+            async with sem:
+                return await self.get_uid_for_hotkey_on_subnet(netuid, hk)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for (hk, netuid), res in zip(task_keys, results):
+        results = await asyncio.gather(
+            *(_bounded(hk, netuid) for hk, netuid in pairs), return_exceptions=True,
+        )
+        for (hk, netuid), res in zip(pairs, results):
             if isinstance(res, Exception) or res is None:
                 continue
             result_map[hk].append((netuid, res))
@@ -407,12 +621,12 @@ class SubstrateClient:
         """Get neuron lite info for a specific uid on a subnet."""
         self._ensure_connected()
         try:
-            result = await self.substrate.runtime_call(
+            result = await self._runtime_call(
                 api="NeuronInfoRuntimeApi",
                 method="get_neuron_lite",
                 params=[netuid, uid],
             )
-            data = result.value if hasattr(result, "value") else result
+            data = _v(result)
             return data if isinstance(data, dict) else None
         except Exception:
             return None
@@ -452,7 +666,9 @@ class SubstrateClient:
             keypair: signing keypair (wallet.coldkey or wallet.hotkey)
             wait_for_inclusion: wait for block inclusion
             wait_for_finalization: wait for finalization
-            era: mortality period, e.g. {"period": 64}
+            era: mortality period; None uses DEFAULT_ERA ({"period": 64}).
+                 A mortal tx is dropped after ~13 minutes if not included,
+                 instead of lingering in the pool; pass "00" for immortal.
             nonce: explicit nonce, auto-fetched if None
             
         Returns:
@@ -466,21 +682,51 @@ class SubstrateClient:
             call_params=call_params,
         )
 
-        extrinsic = await self.substrate.create_signed_extrinsic(
-            call=call,
-            keypair=keypair,
-            era=era,
-            nonce=nonce,
-        )
+        # Fresh dict per call: create_signed_extrinsic writes the birth block ("current") into it
+        era = dict(era or DEFAULT_ERA)
+        auto_nonce = nonce is None
+        if auto_nonce:
+            nonce = await self._reserve_nonces(keypair.ss58_address)
 
-        receipt = await self.substrate.submit_extrinsic(
-            extrinsic,
-            wait_for_inclusion=wait_for_inclusion,
-            wait_for_finalization=wait_for_finalization,
-        )
+        try:
+            extrinsic = await self.substrate.create_signed_extrinsic(
+                call=call,
+                keypair=keypair,
+                era=era,
+                nonce=nonce,
+            )
+
+            receipt = await self.substrate.submit_extrinsic(
+                extrinsic,
+                wait_for_inclusion=wait_for_inclusion,
+                wait_for_finalization=wait_for_finalization,
+            )
+        except Exception:
+            if auto_nonce:
+                # Stale/future nonce or not submitted: re-read from chain next time
+                self._nonces.pop(keypair.ss58_address, None)
+            raise
 
         return receipt
 
+    async def _reserve_nonces(self, ss58_address: str, count: int = 1) -> int:
+        """
+        Reserve `count` consecutive nonces for an account and return the first.
+        Only the first use per account asks the node; later ones count locally.
+        """
+        nonce = self._nonces.get(ss58_address)
+        if nonce is None:
+            fetched = await self.substrate.get_account_nonce(ss58_address)
+            # A concurrent caller may have reserved while we were waiting
+            nonce = max(fetched, self._nonces.get(ss58_address, fetched))
+        self._nonces[ss58_address] = nonce + count
+        return nonce
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached chain reads (rpc_cache) our own extrinsic may have changed."""
+        for name in rpc_cache.EXTRINSIC_AFFECTED:
+            rpc_cache.invalidate(name)
+
     async def compose_and_submit_checked(
         self,
         call_module: str,
@@ -505,6 +751,7 @@ class SubstrateClient:
             )
 
             if await receipt.is_success:
+                self.invalidate_cache()
                 return True, None
             else:
                 error = await receipt.error_message
@@ -514,6 +761,132 @@ class SubstrateClient:
         except Exception as e:
             return False, str(e)
 
+    async def submit_many(
+        self,
+        calls: list[dict],
+        keypair,
+        wait_for_inclusion: bool = True,
+        era: Optional[dict] = None,
+        concurrency: int = SUBMIT_CONCURRENCY,
+    ) -> list[tuple[bool, Optional[str]]]:
+        """
+        Submit several independent extrinsics from one account, pipelined.
+        Unlike submit_batch, each call succeeds or fails on its own.
+
+        The nonce is fetched once and assigned locally (nonce, nonce+1, ...).
+        Extrinsics go to the pool strictly in nonce order, with up to `concurrency`
+        of them awaiting inclusion at a time (concurrency=1: one after another).
+        Inclusion is tracked through the account nonce block by block, and each
+        included extrinsic's receipt is checked in the block that took its nonce.
+        The first rejected submission stops the sequence: later nonces could never
+        be included behind the gap, so the extrinsics after it are not sent.
+
+        Args:
+            calls: list of dicts with {call_module, call_function, call_params}
+            keypair: signing keypair
+            wait_for_inclusion: wait for block inclusion (and check each result)
+            era: mortality period shared by all extrinsics; None uses DEFAULT_ERA
+            concurrency: max extrinsics sent but not yet included
+
+        Returns:
+            [(success, error_message), ...] in the order of `calls`
+        """
+        self._ensure_connected()
+        if not calls:
+            return []
+        # Fresh dict per call (the library writes the birth block into it); shared by this batch
+        era = dict(era or DEFAULT_ERA)
+        try:
+            composed = await asyncio.gather(*[
+                self.substrate.compose_call(
+                    call_module=c["call_module"],
+                    call_function=c["call_function"],
+                    call_params=c["call_params"],
+                )
+                for c in calls
+            ])
+            nonce = await self._reserve_nonces(keypair.ss58_address, len(calls))
+            extrinsics = []
+            for i, call in enumerate(composed):
+                extrinsics.append(await self.substrate.create_signed_extrinsic(
+                    call=call, keypair=keypair, era=era, nonce=nonce + i,
+                ))
+        except Exception as e:
+            self._nonces.pop(keypair.ss58_address, None)
+            return [(False, str(e))] * len(calls)
+
+        ss58 = keypair.ss58_address
+        results: list[Optional[tuple[bool, Optional[str]]]] = [None] * len(extrinsics)
+        pending: dict[int, Any] = {}  # index -> receipt, sent and not yet included
+        sent = 0
+        rejected = False
+        window = max(1, concurrency) if wait_for_inclusion else len(extrinsics)
+
+        async def _send_window() -> None:
+            """Send the next extrinsics in nonce order while the window has room."""
+            nonlocal sent, rejected
+            while not rejected and sent < len(extrinsics) and len(pending) < window:
+                try:
+                    pending[sent] = await self.substrate.submit_extrinsic(extrinsics[sent])
+                except Exception as e:
+                    rejected = True
+                    results[sent] = (False, str(e))
+                sent += 1
+
+        async def _outcome(receipt) -> tuple[bool, Optional[str]]:
+            try:
+                if await receipt.is_success:
+                    return True, None
+                error = await receipt.error_message
+                return False, str(error) if error else "Unknown error"
+            except Exception as e:
+                return False, str(e)
+
+        try:
+            if not wait_for_inclusion:
+                await _send_window()
+                for i in pending:
+                    results[i] = (True, None)
+                pending.clear()
+            else:
+                head = await self.get_current_block()
+                await _send_window()
+                # create_signed_extrinsic wrote the birth block into our copy of the era
+                expires_at = era.get("current", head) + era.get("period", DEFAULT_ERA["period"])
+                while pending:
+                    await asyncio.sleep(INCLUSION_POLL_INTERVAL)
+                    latest = await self.get_current_block()
+                    for number in range(head + 1, latest + 1):
+                        block_hash = await self.substrate.get_block_hash(number)
+                        account = _v(await self._query("System", "Account", [ss58], block_hash=block_hash))
+                        chain_nonce = account.get("nonce", 0) if isinstance(account, dict) else 0
+                        for i in [i for i in pending if nonce + i < chain_nonce]:
+                            receipt = pending.pop(i)
+                            receipt.block_hash = block_hash
+                            results[i] = await _outcome(receipt)
+                    head = latest
+                    if head > expires_at:
+                        for i in pending:
+                            results[i] = (False, "Not included before the extrinsic's era expired")
+                        pending.clear()
+                    await _send_window()
+        except Exception as e:
+            logger.error(f"submit_many stopped: {e}")
+            for i in pending:
+                results[i] = (False, f"Sent, but inclusion is unknown: {e}")
+
+        reason = "an earlier extrinsic was rejected" if rejected else "submission stopped after an error"
+        unsent = [i for i, r in enumerate(results) if r is None]
+        for i in unsent:
+            results[i] = (False, f"Not submitted: {reason}")
+        if rejected or unsent:
+            # Reserved nonces were left unused: re-read the next one from chain
+            self._nonces.pop(ss58, None)
+
+        if any(ok for ok, _ in results):
+            self.invalidate_cache()
+        return results
+
     async def submit_batch(
         self,
         calls: list[dict],
@@ -543,23 +916,17 @@ class SubstrateClient:
                 )
                 composed_calls.append(call)
 
-            batch_call = await self.substrate.compose_call(
+            # Through compose_and_submit so the batch uses the local nonce counter too
+            receipt = await self.compose_and_submit(
                 call_module="Utility",
                 call_function="batch_all",
                 call_params={"calls": composed_calls},
-            )
-
-            extrinsic = await self.substrate.create_signed_extrinsic(
-                call=batch_call,
                 keypair=keypair,
-            )
-
-            receipt = await self.substrate.submit_extrinsic(
-                extrinsic,
                 wait_for_inclusion=wait_for_inclusion,
             )
 
             if await receipt.is_success:
+                self.invalidate_cache()
                 return True, None
             else:
                 error = await receipt.error_message
@@ -3,7 +3,7 @@ TAO transfer operations.
 """
 
 from typing import Optional
-from core.substrate_client import SubstrateClient, tao_to_rao, rao_to_tao
+from core.substrate_client import SubstrateClient, SUBMIT_CONCURRENCY, tao_to_rao, rao_to_tao
 from utils.logger import setup_logger
 
 logger = setup_logger("transfer")
@@ -70,3 +70,34 @@ async def transfer_tao_keep_alive(
         },
         keypair=wallet.coldkey,
     )
+
+
+async def transfer_tao_keep_alive_many(
+    client: SubstrateClient,
+    wallet,
+    transfers: list[tuple[str, float]],
+    concurrency: int = SUBMIT_CONCURRENCY,
+) -> list[tuple[bool, Optional[str]]]:
+    """
+    Several transfer_keep_alive calls from one coldkey, pipelined: signed with
+    consecutive nonces, sent in nonce order and up to `concurrency` awaiting
+    inclusion together instead of one block each (concurrency=1: one at a time).
+    Each transfer succeeds or fails on its own (unlike a batch_all), except that
+    the transfers after a rejected submission are not sent.
+
+    Returns:
+        [(success, error_message), ...] in the order of `transfers`
+    """
+    logger.info(f"transfer_keep_alive x{len(transfers)} (up to {concurrency} pending)")
+    return await client.submit_many(
+        [
+            {
+                "call_module": "Balances",
+                "call_function": "transfer_keep_alive",
+                "call_params": {"dest": dest_ss58, "value": tao_to_rao(tao_amount)},
+            }
+            for dest_ss58, tao_amount in transfers
+        ],
+        keypair=wallet.coldkey,
+        concurrency=concurrency,
+    )
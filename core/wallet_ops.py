@@ -4,6 +4,8 @@ Handles coldkey/hotkey creation, listing, and loading.
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from bittensor_wallet import Wallet
@@ -11,6 +13,28 @@ from utils.logger import setup_logger
 
 logger = setup_logger("wallet_ops")
 
+KEYFILE_WORKERS = 8  # threads for wallet-dir scans and keyfile reads (disk-bound)
+_KEYFILE_POOL: Optional[ThreadPoolExecutor] = None
+
+# Numbered hotkey names ("1", "2", ...); matching avoids raising ValueError per named hotkey
+_is_number = re.compile(r"[0-9]+").fullmatch
+
+
+def _hotkey_sort_key(name: str) -> tuple:
+    """Numbered hotkeys first in numeric order ("2" before "10"), then named ones alphabetically."""
+    return (0, int(name), "") if _is_number(name) else (1, 0, name)
+
+
+def keyfile_executor() -> ThreadPoolExecutor:
+    """
+    Shared pool for wallet directory scans and keyfile loads, created on first use.
+    Kept apart from asyncio's default executor so disk reads don't take its slots.
+    """
+    global _KEYFILE_POOL
+    if _KEYFILE_POOL is None:
+        _KEYFILE_POOL = ThreadPoolExecutor(max_workers=KEYFILE_WORKERS, thread_name_prefix="btm-keyfile")
+    return _KEYFILE_POOL
+
 
 def get_wallets_path(base_path: str = "~/.bittensor/wallets") -> Path:
     """Get expanded wallets directory path."""
@@ -23,27 +47,39 @@ def list_wallets(base_path: str = "~/.bittensor/wallets") -> list[dict]:
     Returns list of dicts: {name, coldkey_exists, hotkeys: [str]}
     """
     wallets_dir = get_wallets_path(base_path)
-    if not wallets_dir.exists():
+    try:
+        with os.scandir(wallets_dir) as it:
+            wallet_dirs = sorted(
+                (entry.name, entry.path) for entry in it if entry.is_dir()
+            )
+    except FileNotFoundError:
         return []
 
-    wallets = []
-    for entry in sorted(wallets_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        wallet_info = {
-            "name": entry.name,
-            "coldkey_exists": (entry / "coldkey").exists() or (entry / "coldkeypub.txt").exists(),
-            "hotkeys": [],
-        }
-        hotkeys_dir = entry / "hotkeys"
-        if hotkeys_dir.exists():
-            wallet_info["hotkeys"] = sorted([
-                hk.name for hk in hotkeys_dir.iterdir()
-                if hk.is_file() and not hk.name.endswith("pub.txt")
-            ])
-        wallets.append(wallet_info)
-
-    return wallets
+    # Per-wallet scans are independent directory reads; overlap them (helps on slow/network disks)
+    if not wallet_dirs:
+        return []
+    return list(keyfile_executor().map(_scan_wallet_dir, *zip(*wallet_dirs)))
+
+
+def _scan_wallet_dir(name: str, path: str) -> dict:
+    """One scandir of the wallet dir and one of its hotkeys dir (DirEntry types need no extra stat)."""
+    with os.scandir(path) as it:
+        children = {entry.name: entry.is_dir() for entry in it}
+
+    hotkeys = []
+    if children.get("hotkeys"):
+        with os.scandir(os.path.join(path, "hotkeys")) as it:
+            hotkeys = sorted(
+                (entry.name for entry in it
+                 if entry.is_file() and not entry.name.endswith("pub.txt")),
+                key=_hotkey_sort_key,
+            )
+
+    return {
+        "name": name,
+        "coldkey_exists": "coldkey" in children or "coldkeypub.txt" in children,
+        "hotkeys": hotkeys,
+    }
 
 
 def load_wallet(
@@ -59,16 +95,81 @@ def load_wallet(
     return wallet
 
 
+def unlock_coldkey(wallet: Wallet) -> Wallet:
+    """
+    Decrypt the wallet's coldkey (keyfile read + scrypt). Blocking, and
+    prompts for the password when the coldkey is encrypted.
+    """
+    _ = wallet.coldkey
+    return wallet
+
+
+def coldkey_is_encrypted(wallet: Wallet) -> bool:
+    """Whether unlocking needs a password. Unreadable keyfiles count as encrypted."""
+    try:
+        return wallet.coldkey_file.is_encrypted()
+    except Exception:
+        return True
+
+
+# (coldkeypub path, mtime_ns) -> ss58; recreating a wallet changes the mtime and misses
+_COLDKEY_SS58_CACHE: dict[tuple[str, int], str] = {}
+
+
 def get_coldkey_ss58(
     coldkey_name: str,
     base_path: str = "~/.bittensor/wallets",
 ) -> Optional[str]:
-    """Get SS58 address for a coldkey without unlocking it."""
+    """Get SS58 address for a coldkey without unlocking it. Memoized per coldkeypub file."""
+    path = os.path.join(os.path.expanduser(base_path), coldkey_name, "coldkeypub.txt")
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        key = None
+    else:
+        ss58 = _COLDKEY_SS58_CACHE.get(key)
+        if ss58 is not None:
+            return ss58
+
     wallet = Wallet(name=coldkey_name, path=base_path)
     try:
-        return wallet.coldkeypub.ss58_address
+        ss58 = wallet.coldkeypub.ss58_address
     except Exception:
         return None
+    if key is not None:
+        _COLDKEY_SS58_CACHE[key] = ss58
+    return ss58
+
+
+# (hotkey file path, mtime_ns) -> ss58; a changed or replaced keyfile misses naturally
+_HOTKEY_SS58_CACHE: dict[tuple[str, int], str] = {}
+
+
+def load_hotkey_ss58s(
+    coldkey_name: str,
+    hotkey_names: list[str],
+    base_path: str = "~/.bittensor/wallets",
+) -> list[tuple[str, str]]:
+    """
+    [(hotkey_name, ss58)] for the hotkeys that load. Blocking file I/O:
+    call through asyncio.to_thread from async code.
+    Repeat calls skip keyfile parsing while the file is unchanged.
+    """
+    hotkeys_dir = os.path.join(os.path.expanduser(base_path), coldkey_name, "hotkeys")
+    out = []
+    for hk_name in hotkey_names:
+        path = os.path.join(hotkeys_dir, hk_name)
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+            ss58 = _HOTKEY_SS58_CACHE.get(key)
+            if ss58 is None:
+                hw = Wallet(name=coldkey_name, hotkey=hk_name, path=base_path)
+                ss58 = hw.hotkey.ss58_address
+                _HOTKEY_SS58_CACHE[key] = ss58
+        except Exception:
+            continue
+        out.append((hk_name, ss58))
+    return out
 
 
 def create_coldkey(
@@ -89,6 +190,26 @@ def create_coldkey(
     return wallet
 
 
+def _create_numbered_hotkeys(coldkey_name: str, numbers: range, base_path: str) -> None:
+    """
+    Create unencrypted hotkeys named by `numbers` in parallel.
+    Each key is independent (mnemonic + own file); the key derivation runs in the
+    native bittensor_wallet core, so threads overlap instead of queueing on the GIL.
+    """
+    def _create(i: int) -> None:
+        hw = Wallet(name=coldkey_name, hotkey=str(i), path=base_path)
+        hw.create_new_hotkey(use_password=False, overwrite=False, suppress=True)
+
+    if len(numbers) <= 1:
+        for i in numbers:
+            _create(i)
+        return
+    workers = min(len(numbers), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first failure
+        list(pool.map(_create, numbers))
+
+
 def create_coldkey_with_hotkeys(
     name: str,
     hotkey_count: int,
@@ -113,9 +234,7 @@ def create_coldkey_with_hotkeys(
     )
     logger.info(f"Created coldkey: {name} -> {wallet.coldkeypub.ss58_address}")
 
-    for i in range(1, hotkey_count + 1):
-        hw = Wallet(name=name, hotkey=str(i), path=base_path)
-        hw.create_new_hotkey(use_password=False, overwrite=False, suppress=True)
+    _create_numbered_hotkeys(name, range(1, hotkey_count + 1), base_path)
 
     logger.info(f"Created {hotkey_count} hotkeys for {name}")
     return wallet, hotkey_count
@@ -135,21 +254,19 @@ def add_hotkeys_to_wallet(
     wallets_dir = get_wallets_path(base_path)
     hotkeys_dir = wallets_dir / coldkey_name / "hotkeys"
 
-    # Find existing numbered hotkeys
+    # Find existing numbered hotkeys (non-numeric names are skipped)
     existing_nums = set()
-    if hotkeys_dir.exists():
-        for f in hotkeys_dir.iterdir():
-            if f.is_file() and not f.name.endswith("pub.txt"):
-                try:
-                    existing_nums.add(int(f.name))
-                except ValueError:
-                    pass  # non-numeric hotkey name, skip
+    try:
+        with os.scandir(hotkeys_dir) as it:
+            for entry in it:
+                if _is_number(entry.name) and entry.is_file():
+                    existing_nums.add(int(entry.name))
+    except FileNotFoundError:
+        pass
 
     start = max(existing_nums) + 1 if existing_nums else 1
 
-    for i in range(start, start + count):
-        hw = Wallet(name=coldkey_name, hotkey=str(i), path=base_path)
-        hw.create_new_hotkey(use_password=False, overwrite=False, suppress=True)
+    _create_numbered_hotkeys(coldkey_name, range(start, start + count), base_path)
 
     end = start + count - 1
     logger.info(f"Added hotkeys {start}-{end} to {coldkey_name}")
@@ -207,9 +324,7 @@ def batch_create_wallets(
             on_progress(name, f"coldkey created ({ss58[:16]}...)")
 
         # Create hotkeys
-        for i in range(1, hotkey_count + 1):
-            hw = Wallet(name=name, hotkey=str(i), path=base_path)
-            hw.create_new_hotkey(use_password=False, overwrite=False, suppress=True)
+        _create_numbered_hotkeys(name, range(1, hotkey_count + 1), base_path)
 
         logger.info(f"Created {hotkey_count} hotkeys for {name}")
         if on_progress:
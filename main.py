@@ -7,14 +7,14 @@ No btcli dependency.
 
 import asyncio
 import sys
-from rich.console import Console
+import traceback
 
 from utils.config import load_config
 from core.substrate_client import SubstrateClient
+from core.stats import close_http_session, start_price_refresher, stop_price_refresher
+from ui.display import console
 from ui.menus import main_menu_loop
 
-console = Console()
-
 
 async def main():
     config = load_config("config.yaml")
@@ -25,12 +25,19 @@ async def main():
     console.print(f"\n[bold cyan]Bittensor Manager v2[/bold cyan]")
     console.print(f"[dim]Connecting to {rpc}...[/dim]")
 
-    client = SubstrateClient(url=rpc, fallbacks=fallbacks)
+    client = SubstrateClient(
+        url=rpc,
+        fallbacks=fallbacks,
+        disk_cache=config.get("metadata_disk_cache", False),
+        rate_limit=config.get("rpc_rate_limit", 0),
+        burst=config.get("rpc_burst", 0),
+    )
 
     try:
         await client.connect()
         block = await client.get_current_block()
         console.print(f"[green]✓ Connected[/green] | Block: [cyan]{block:,}[/cyan]")
+        start_price_refresher()
 
         await main_menu_loop(client, config)
 
@@ -38,12 +45,19 @@ async def main():
         console.print("\n[dim]Interrupted[/dim]")
     except Exception as e:
         console.print(f"\n[bold red]Fatal error:[/bold red] {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
     finally:
+        await stop_price_refresher()
+        await close_http_session()
         await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (optional, not on Windows) lowers per-callback overhead on the WS/HTTP fan-outs
+    try:
+        import uvloop
+        run = uvloop.run  # uvloop >= 0.18
+    except (ImportError, AttributeError):
+        run = asyncio.run
+    run(main())
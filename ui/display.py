@@ -2,12 +2,32 @@
 Display helpers using Rich for formatted output.
 """
 
-from rich.console import Console
+import sys
+from collections import Counter
+from operator import itemgetter
+
+from rich.console import Console, Group
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
-console = Console()
+# The one Console for the app (main.py and ui.menus import it from here).
+# highlight=False: output is explicit markup, so skip the repr-highlighter regex pass per print.
+console = Console(highlight=False)
 
 BLOCKS_PER_DAY = 7200
+# Row separators only on tables short enough to fit on screen (each one doubles the line count)
+SHOW_LINES_MAX_ROWS = 20
+_INC_SCALE = 100.0 / 65535.0  # u16 incentive -> percent
+
+# Piped/redirected stdout gets plain tab-separated tables instead of Rich rendering
+IS_TTY = sys.stdout.isatty()
+
+# Subnet table cells without the two USD columns (no TAO price available)
+_NO_USD_CELLS = itemgetter(0, 1, 2, 3, 4, 5, 6, 8, 10, 11)
+
+# Parsed once, shared by every styled cell
+_BOLD = Style(bold=True)
 
 
 def print_header(text: str):
@@ -34,7 +54,10 @@ def print_info(text: str):
 
 def display_balance_table(balances: list[dict], tao_price: float = None):
     """Display balance table with full addresses, staked, and totals."""
-    table = Table(title="TAO Balances", show_lines=True)
+    if not IS_TTY:
+        _write_balance_tsv(balances, tao_price)
+        return
+    table = Table(title="TAO Balances", show_lines=len(balances) <= SHOW_LINES_MAX_ROWS)
     table.add_column("Wallet", style="cyan")
     table.add_column("Address", style="dim", no_wrap=True)
     table.add_column("Free (τ)", justify="right", style="green")
@@ -57,10 +80,11 @@ def display_balance_table(balances: list[dict], tao_price: float = None):
         table.add_row(*row)
 
     grand = total_free + total_staked
-    total_row = ["[bold]TOTAL[/bold]", "", f"[bold]{total_free:.6f}[/bold]",
-                 f"[bold]{total_staked:.6f}[/bold]", f"[bold]{grand:.6f}[/bold]"]
+    # Styled Text cells skip the markup parser
+    total_row = [Text("TOTAL", style=_BOLD), "", Text(f"{total_free:.6f}", style=_BOLD),
+                 Text(f"{total_staked:.6f}", style=_BOLD), Text(f"{grand:.6f}", style=_BOLD)]
     if tao_price:
-        total_row.append(f"[bold]${grand * tao_price:,.2f}[/bold]")
+        total_row.append(Text(f"${grand * tao_price:,.2f}", style=_BOLD))
     table.add_row(*total_row)
 
     console.print(table)
@@ -68,19 +92,54 @@ def display_balance_table(balances: list[dict], tao_price: float = None):
         console.print(f"  TAO price: [yellow]${tao_price:.2f}[/yellow]")
 
 
+def _write_balance_tsv(balances: list[dict], tao_price: float = None):
+    """Piped/redirected output: tab-separated rows in one write, no ANSI or box drawing."""
+    header = ["wallet", "address", "free_tao", "staked_tao", "total_tao"]
+    if tao_price:
+        header.append("usd")
+    rows = ["\t".join(header)]
+    total_free = 0.0
+    total_staked = 0.0
+    for b in balances:
+        free = b["free_tao"]
+        staked = b.get("staked_tao", 0.0)
+        total = free + staked
+        total_free += free
+        total_staked += staked
+        row = [b.get("name", ""), b["address"], f"{free:.6f}", f"{staked:.6f}", f"{total:.6f}"]
+        if tao_price:
+            row.append(f"{total * tao_price:.2f}")
+        rows.append("\t".join(row))
+    grand = total_free + total_staked
+    row = ["TOTAL", "", f"{total_free:.6f}", f"{total_staked:.6f}", f"{grand:.6f}"]
+    if tao_price:
+        row.append(f"{grand * tao_price:.2f}")
+    rows.append("\t".join(row))
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
+
+
 def display_wallet_stats(stats: dict, wallet_name: str = ""):
     """Display comprehensive wallet stats with USD."""
+    console.print(Group(*_wallet_stats_renderables(stats, wallet_name)))
+
+
+def _wallet_stats_renderables(stats: dict, wallet_name: str = "") -> list:
+    """Renderables for one wallet's stats; callers print them in a single Group."""
     addr = stats["address"]
     tao_price = stats.get("tao_price_usd")
     name_str = f" ({wallet_name})" if wallet_name else ""
 
-    console.print(f"\n[bold]Wallet:[/bold] [cyan]{addr}[/cyan]{name_str}")
-    console.print(f"[bold]Free Balance:[/bold] [green]{stats['free_balance_tao']:.4f}[/green] TAO")
-    console.print(f"[bold]Total Staked:[/bold] [yellow]{stats['total_staked_tao']:.4f}[/yellow] TAO (est.)")
-    console.print(f"[bold]Total Value:[/bold] [bold green]{stats['total_value_tao']:.4f}[/bold green] TAO")
+    out = [
+        "",
+        f"[bold]Wallet:[/bold] [cyan]{addr}[/cyan]{name_str}",
+        f"[bold]Free Balance:[/bold] [green]{stats['free_balance_tao']:.4f}[/green] TAO",
+        f"[bold]Total Staked:[/bold] [yellow]{stats['total_staked_tao']:.4f}[/yellow] TAO (est.)",
+        f"[bold]Total Value:[/bold] [bold green]{stats['total_value_tao']:.4f}[/bold green] TAO",
+    ]
 
     if stats.get("total_value_usd") is not None:
-        console.print(
+        out.append(
             f"[bold]USD Value:[/bold] [bold green]${stats['total_value_usd']:,.2f}[/bold green] "
             f"(TAO = ${tao_price:.2f})"
         )
@@ -90,13 +149,13 @@ def display_wallet_stats(stats: dict, wallet_name: str = ""):
     if em_per_blk > 0 and tao_price:
         daily_tao = em_per_blk * BLOCKS_PER_DAY
         daily_usd = daily_tao * tao_price
-        console.print(
+        out.append(
             f"[bold]Daily Emission:[/bold] [magenta]{daily_tao:.4f} τ/day[/magenta]"
             f" [bold green](${daily_usd:,.2f}/day)[/bold green]"
         )
 
     if stats["subnets"]:
-        table = Table(title="Registered Subnets", show_lines=True)
+        table = Table(title="Registered Subnets", show_lines=len(stats["subnets"]) <= SHOW_LINES_MAX_ROWS)
         table.add_column("SN", style="cyan", justify="right")
         table.add_column("Name", style="white")
         table.add_column("HK", style="bold white", justify="right")
@@ -112,84 +171,92 @@ def display_wallet_stats(stats: dict, wallet_name: str = ""):
         table.add_column("Inc", justify="right", style="blue")
         table.add_column("Reg", justify="center")
 
-        for s in stats["subnets"]:
-            hk = str(s["hotkey"])
-            hk_name = s.get("hotkey_name", "") or ""
-            reg = "✓" if s["is_registered"] else "✗"
-            uid_str = str(s["uid"]) if s.get("uid") is not None else "-"
-            inc = s.get("incentive", 0)
-            inc_str = f"{inc/65535*100:.1f}%" if inc else "0"
-            em_per_block = s.get("emission", 0)
-            daily_tao = em_per_block * BLOCKS_PER_DAY
-            row = [
-                str(s["netuid"]),
-                s["subnet_name"],
-                hk_name,
-                hk,
-                uid_str,
-                f"{s['alpha_stake']:.4f}",
-                f"{s['tao_value']:.4f}",
-            ]
-            if tao_price:
-                row.append(f"${s['tao_value'] * tao_price:,.2f}")
-            row.append(f"{daily_tao:.6f}")
-            if tao_price:
-                row.append(f"${daily_tao * tao_price:,.2f}")
-            row.extend([inc_str, reg])
-            table.add_row(*row)
-
-        console.print(table)
+        # All cells built in one comprehension, then fed to add_row in a single loop
+        price = tao_price or 0.0
+        daily_usd_factor = BLOCKS_PER_DAY * price  # emission/block -> $/day in one multiply
+        rows = [
+            (
+                str(s.netuid),
+                s.subnet_name,
+                s.hotkey_name or "",
+                str(s.hotkey),
+                str(s.uid) if s.uid is not None else "-",
+                f"{s.alpha_stake:.4f}",
+                f"{s.tao_value:.4f}",
+                f"${s.tao_value * price:,.2f}",
+                f"{s.emission * BLOCKS_PER_DAY:.6f}",
+                f"${s.emission * daily_usd_factor:,.2f}",
+                f"{s.incentive * _INC_SCALE:.1f}%" if s.incentive else "0",
+                "✓" if s.is_registered else "✗",
+            )
+            for s in stats["subnets"]
+        ]
+        if not tao_price:
+            rows = map(_NO_USD_CELLS, rows)
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+
+        out.append(table)
     else:
-        console.print("  [dim]No registrations found[/dim]")
+        out.append("  [dim]No registrations found[/dim]")
+    return out
 
 
-def display_multi_wallet_stats(all_stats: list[tuple[str, dict]]):
-    """Display combined stats for multiple wallets with grand totals."""
+def display_grand_totals(all_stats: list[tuple[str, dict]]):
+    """Grand totals section only, for callers that already printed each wallet."""
+    out = _grand_total_renderables(all_stats)
+    if out:
+        console.print(Group(*out))
+
+
+def _grand_total_renderables(all_stats: list[tuple[str, dict]]) -> list:
+    """GRAND TOTAL block (sums + registration counts in one pass); empty for a single wallet."""
+    if len(all_stats) <= 1:
+        return []
+
     grand_free = 0.0
     grand_staked = 0.0
     grand_total = 0.0
     grand_emission_per_block = 0.0
     tao_price = None
+    subnet_reg_count = Counter()  # {(netuid, name): registered hotkeys}
 
-    for name, stats in all_stats:
-        display_wallet_stats(stats, wallet_name=name)
+    for _, stats in all_stats:
         grand_free += stats["free_balance_tao"]
         grand_staked += stats["total_staked_tao"]
         grand_total += stats["total_value_tao"]
         grand_emission_per_block += stats.get("total_emission_tao_per_block", 0.0)
         if stats.get("tao_price_usd"):
             tao_price = stats["tao_price_usd"]
-        console.print()
-
-    if len(all_stats) > 1:
-        console.print(f"[bold cyan]{'─' * 50}[/bold cyan]")
-        console.print(f"[bold]GRAND TOTAL ({len(all_stats)} wallets):[/bold]")
-        console.print(f"  Free: [green]{grand_free:.4f}[/green] TAO")
-        console.print(f"  Staked: [yellow]{grand_staked:.4f}[/yellow] TAO (est.)")
-        console.print(f"  Total: [bold green]{grand_total:.4f}[/bold green] TAO")
+        subnet_reg_count.update(
+            (s.netuid, s.subnet_name) for s in stats.get("subnets", ()) if s.is_registered
+        )
+
+    out = [
+        f"[bold cyan]{'─' * 50}[/bold cyan]",
+        f"[bold]GRAND TOTAL ({len(all_stats)} wallets):[/bold]",
+        f"  Free: [green]{grand_free:.4f}[/green] TAO",
+        f"  Staked: [yellow]{grand_staked:.4f}[/yellow] TAO (est.)",
+        f"  Total: [bold green]{grand_total:.4f}[/bold green] TAO",
+    ]
+    if tao_price:
+        out.append(f"  USD: [bold green]${grand_total * tao_price:,.2f}[/bold green] (TAO = ${tao_price:.2f})")
+    if grand_emission_per_block > 0:
+        daily_tao = grand_emission_per_block * BLOCKS_PER_DAY
+        line = f"  Daily Emission: [bold magenta]{daily_tao:.4f} τ/day[/bold magenta]"
         if tao_price:
-            console.print(f"  USD: [bold green]${grand_total * tao_price:,.2f}[/bold green] (TAO = ${tao_price:.2f})")
-        if grand_emission_per_block > 0:
-            daily_tao = grand_emission_per_block * BLOCKS_PER_DAY
-            console.print(f"  Daily Emission: [bold magenta]{daily_tao:.4f} τ/day[/bold magenta]", end="")
-            if tao_price:
-                daily_usd = daily_tao * tao_price
-                console.print(f" [bold green](${daily_usd:,.2f}/day)[/bold green]")
-            else:
-                console.print()
-
-        # Subnet registration summary
-        subnet_reg_count = {}  # {(netuid, name): count}
-        for _, stats in all_stats:
-            for s in stats.get("subnets", []):
-                if s.get("is_registered"):
-                    key = (s["netuid"], s["subnet_name"])
-                    subnet_reg_count[key] = subnet_reg_count.get(key, 0) + 1
-        if subnet_reg_count:
-            total_reg = sum(subnet_reg_count.values())
-            console.print(f"  [bold]Registrations ({total_reg} total):[/bold]")
-            for (netuid, name), count in sorted(subnet_reg_count.items()):
-                console.print(f"    SN{netuid} {name}: [cyan]{count}[/cyan] hotkeys")
+            daily_usd = daily_tao * tao_price
+            line += f" [bold green](${daily_usd:,.2f}/day)[/bold green]"
+        out.append(line)
+
+    # Subnet registration summary
+    if subnet_reg_count:
+        total_reg = sum(subnet_reg_count.values())
+        out.append(f"  [bold]Registrations ({total_reg} total):[/bold]")
+        for (netuid, name), count in sorted(subnet_reg_count.items()):
+            out.append(f"    SN{netuid} {name}: [cyan]{count}[/cyan] hotkeys")
+    return out
 
 
 def display_subnet_overview(info: dict, tao_price: float = None):
@@ -230,7 +297,7 @@ def display_subnet_overview(info: dict, tao_price: float = None):
 
 def display_wallet_list(wallets: list[dict]):
     """Display wallet list for selection."""
-    table = Table(title="Available Wallets", show_lines=True)
+    table = Table(title="Available Wallets", show_lines=len(wallets) <= SHOW_LINES_MAX_ROWS)
     table.add_column("#", style="cyan", justify="right")
     table.add_column("Name", style="bold white")
     table.add_column("Coldkey", justify="center")
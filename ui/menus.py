@@ -3,26 +3,44 @@ Interactive menu system using Rich.
 """
 
 import asyncio
+import bisect
+import math
+import sys
+import traceback
+from functools import partial
+from operator import itemgetter
+from rich.console import Group
 from rich.prompt import Prompt, IntPrompt, Confirm, FloatPrompt
 from rich.table import Table
+from rich.text import Text
 
-from core.substrate_client import SubstrateClient, rao_to_tao, tao_to_rao, decode_price, decode_bytes
+from core.substrate_client import (
+    SubstrateClient, RAO_PER_TAO, FIELDS_EPOCH, FIELDS_PRUNING, SUBMIT_CONCURRENCY,
+    rao_to_tao, tao_to_rao, decode_price, decode_bytes,
+)
 from core.wallet_ops import (
-    list_wallets, load_wallet, get_coldkey_ss58,
+    list_wallets, load_wallet, get_coldkey_ss58, load_hotkey_ss58s, keyfile_executor,
+    unlock_coldkey, coldkey_is_encrypted,
     create_coldkey_with_hotkeys, add_hotkeys_to_wallet, create_hotkey,
     batch_create_wallets,
 )
 from core.balance import check_balance, check_all_balances
 from core.staking import add_stake, remove_stake, unstake_all, unstake_subnet
 from core.registration import burn_register, get_registration_info, check_registration_status
-from core.transfer import transfer_tao, transfer_tao_keep_alive
-from core.stats import get_wallet_stats, get_subnet_overview, fetch_tao_price
+from core.transfer import transfer_tao, transfer_tao_keep_alive, transfer_tao_keep_alive_many
+from core.stats import (
+    get_wallet_stats, get_subnet_overview, fetch_tao_price, decode_ss58,
+)
 from ui.display import (
     console, print_header, print_success, print_error, print_warn, print_info,
-    display_balance_table, display_wallet_stats, display_multi_wallet_stats,
-    display_subnet_overview, display_wallet_list,
+    display_balance_table, display_wallet_stats, display_grand_totals,
+    display_subnet_overview, display_wallet_list, SHOW_LINES_MAX_ROWS,
 )
 from utils.wallet_groups import load_groups, create_group, delete_group, get_group, list_group_names
+from utils import rpc_cache
+from utils.logger import setup_logger, flush_logs
+
+logger = setup_logger("menus")
 
 MENU_OPTIONS = [
     ("1", "Create Wallet (Coldkey/Hotkey)"),
@@ -39,17 +57,31 @@ MENU_OPTIONS = [
 
 TAOSTATS_VALIDATOR = "5GKH9FPPnWSUoeeTJp19wVtd84XqFW4pyK2ijV2GsFbhTrP1"
 
+DEFAULT_RPC_CONCURRENCY = 16  # per-wallet fan-outs in flight (config: rpc_max_concurrency)
 
-def show_main_menu():
-    console.print("\n[bold cyan]╔══════════════════════════════════════╗[/bold cyan]")
-    console.print("[bold cyan]║[/bold cyan]    [bold white]Bittensor Manager v2[/bold white]              [bold cyan]║[/bold cyan]")
-    console.print("[bold cyan]╚══════════════════════════════════════╝[/bold cyan]")
+
+def _build_main_menu() -> Group:
+    """Banner + options, markup parsed once at import."""
+    lines = [
+        "",
+        "[bold cyan]╔══════════════════════════════════════╗[/bold cyan]",
+        "[bold cyan]║[/bold cyan]    [bold white]Bittensor Manager v2[/bold white]              [bold cyan]║[/bold cyan]",
+        "[bold cyan]╚══════════════════════════════════════╝[/bold cyan]",
+    ]
     for key, label in MENU_OPTIONS:
         if key == "0":
-            console.print(f"  [dim]{key}.[/dim] [dim]{label}[/dim]")
+            lines.append(f"  [dim]{key}.[/dim] [dim]{label}[/dim]")
         else:
-            console.print(f"  [cyan]{key}.[/cyan] {label}")
-    console.print()
+            lines.append(f"  [cyan]{key}.[/cyan] {label}")
+    lines.append("")
+    return Group(*(Text.from_markup(line) for line in lines))
+
+
+_MAIN_MENU = _build_main_menu()
+
+
+def show_main_menu():
+    console.print(_MAIN_MENU)
 
 
 # ========================================================================
@@ -81,6 +113,8 @@ def _resolve_wallets(input_str: str, wallets: list[dict]) -> list[dict]:
     parts = [p.strip() for p in input_str.split(",") if p.strip()]
     result = []
     name_map = {w["name"]: w for w in wallets}
+    # Sorted names: each prefix match is a bisect plus a walk over the matches only
+    names = sorted(name_map)
 
     for part in parts:
         if part in name_map:
@@ -93,19 +127,20 @@ def _resolve_wallets(input_str: str, wallets: list[dict]) -> list[dict]:
                 continue
         except ValueError:
             pass
-        matches = [w for w in wallets if w["name"].startswith(part)]
-        if matches:
-            result.extend(matches)
+        i = bisect.bisect_left(names, part)
+        start = i
+        while i < len(names) and names[i].startswith(part):
+            i += 1
+        if i > start:
+            result.extend(name_map[n] for n in names[start:i])
         else:
             console.print(f"  [yellow]'{part}' not found, skipping[/yellow]")
 
-    seen = set()
-    deduped = []
+    # Dedupe by name, keeping first-seen order
+    deduped = {}
     for w in result:
-        if w["name"] not in seen:
-            seen.add(w["name"])
-            deduped.append(w)
-    return deduped
+        deduped.setdefault(w["name"], w)
+    return list(deduped.values())
 
 
 def select_wallets(base_path: str, prompt: str = "Select wallet(s)", allow_multi: bool = True) -> list[dict]:
@@ -161,6 +196,17 @@ def select_hotkey(wallet: dict) -> list[str] | None:
     return result if result else None
 
 
+async def _unlock_coldkey(wallet):
+    """
+    Decrypt the wallet's coldkey without blocking the event loop. Password-less
+    keyfiles decrypt on the keyfile pool; encrypted ones prompt on the main thread,
+    one at a time. Returns the wallet.
+    """
+    if coldkey_is_encrypted(wallet):
+        return unlock_coldkey(wallet)
+    return await asyncio.get_running_loop().run_in_executor(keyfile_executor(), unlock_coldkey, wallet)
+
+
 # ========================================================================
 # 1. Create Wallet
 # ========================================================================
@@ -267,21 +313,32 @@ async def handle_check_balances(client: SubstrateClient, config: dict):
         return
 
     console.print(f"  Checking {len(addresses)} wallets...")
-    tao_price = await fetch_tao_price()
 
     async def get_balance_with_stake(a):
-        bal = await check_balance(client, a["address"])
-        bal["name"] = a["name"]
-        try:
-            stats = await get_wallet_stats(client, a["address"], include_usd=False)
-            bal["staked_tao"] = stats.get("total_staked_tao", 0.0)
-        except Exception:
-            bal["staked_tao"] = 0.0
-        return bal
+        # get_wallet_stats already reads the free balance alongside the stakes
+        stats = await get_wallet_stats(client, a["address"], include_usd=False)
+        if "balance" in stats["failed"]:
+            raise RuntimeError("balance query failed")
+        return {
+            "name": a["name"],
+            "address": a["address"],
+            "free_tao": stats["free_balance_tao"],
+            "staked_tao": stats["total_staked_tao"],
+        }
 
+    # Price fetch overlaps the balance queries instead of running before them
     tasks = [get_balance_with_stake(a) for a in addresses]
-    balances = await asyncio.gather(*tasks, return_exceptions=True)
-    balances = [b for b in balances if not isinstance(b, Exception)]
+    results, tao_price = await asyncio.gather(
+        asyncio.gather(*tasks, return_exceptions=True),
+        fetch_tao_price(),
+    )
+    # A failed read leaves the wallet out instead of showing it as 0 TAO
+    balances = []
+    for a, r in zip(addresses, results):
+        if isinstance(r, Exception):
+            print_warn(f"{a['name']}: balance unavailable ({r})")
+        else:
+            balances.append(r)
 
     display_balance_table(balances, tao_price=tao_price)
 
@@ -308,72 +365,80 @@ async def handle_wallet_stats(client: SubstrateClient, config: dict):
 
     show_usd = config.get("display", {}).get("show_usd_prices", True)
 
-    # Build global neuron cache once (all subnets, ~10s)
-    console.print("  [dim]Loading neuron data from all subnets...[/dim]")
-    from core.stats import build_global_neuron_cache
-    neuron_cache = await build_global_neuron_cache(client)
-    console.print(f"  [dim]Cached {len(neuron_cache)} hotkeys[/dim]")
-
-    # Pre-fetch shared data once (avoids redundant calls per wallet)
-    console.print("  [dim]Fetching subnet prices and TAO price...[/dim]")
-    shared_dynamic = await client.get_all_dynamic_info()
-    shared_price = await fetch_tao_price() if show_usd else None
-
     all_stats = []
 
-    # Phase 1: Pre-load all hotkey maps (disk I/O, synchronous but fast)
-    console.print(f"  [dim]Loading hotkey data for {len(selected)} wallets...[/dim]")
-    from bittensor_wallet import Wallet
+    def load_one(w):
+        addr = get_coldkey_ss58(w["name"], base_path)
+        if not addr:
+            return None
+        pairs = load_hotkey_ss58s(w["name"], w.get("hotkeys") or [], base_path)
+        return (w["name"], addr, [ss58 for _, ss58 in pairs], {ss58: name for name, ss58 in pairs})
+
+    # Neuron scan (all subnets, ~10s), subnet prices, TAO price and hotkey files are
+    # independent: fetch them together, once, and share them across wallets.
+    console.print(f"  [dim]Loading neuron data, prices and hotkeys for {len(selected)} wallets...[/dim]")
     import time
     t0 = time.time()
+    from core.stats import build_global_neuron_cache
 
-    wallet_data = []  # (name, addr, hotkey_ss58_list, hotkey_name_map)
-    for w in selected:
-        addr = get_coldkey_ss58(w["name"], base_path)
-        if not addr:
-            continue
-        hotkey_ss58_list = []
-        hotkey_name_map = {}
-        for hk_name in (w.get("hotkeys") or []):
-            try:
-                hw = Wallet(name=w["name"], hotkey=hk_name, path=base_path)
-                hk_ss58 = hw.hotkey.ss58_address
-                hotkey_ss58_list.append(hk_ss58)
-                hotkey_name_map[hk_ss58] = hk_name
-            except Exception:
-                pass
-        wallet_data.append((w["name"], addr, hotkey_ss58_list, hotkey_name_map))
+    # Keyfile reads are blocking: run them on the keyfile pool, off the event loop
+    loop = asyncio.get_running_loop()
+    pool = keyfile_executor()
+    fetches = [
+        build_global_neuron_cache(client),
+        rpc_cache.all_dynamic_info(client),
+        asyncio.gather(*[loop.run_in_executor(pool, load_one, w) for w in selected]),
+    ]
+    if show_usd:
+        fetches.append(fetch_tao_price())
+    neuron_cache, shared_dynamic, loaded, *price = await asyncio.gather(*fetches)
+    shared_price = price[0] if price else None
+    wallet_data = [d for d in loaded if d]  # (name, addr, hotkey_ss58_list, hotkey_name_map)
 
     t1 = time.time()
-    console.print(f"  [dim]Loaded {sum(len(d[2]) for d in wallet_data)} hotkeys in {t1-t0:.1f}s[/dim]")
+    console.print(
+        f"  [dim]Cached {len(neuron_cache)} neuron hotkeys, loaded "
+        f"{sum(len(d[2]) for d in wallet_data)} wallet hotkeys in {t1-t0:.1f}s[/dim]"
+    )
 
-    # Phase 2: Fetch all wallet stats in parallel
+    # Fetch all wallet stats in parallel
     console.print(f"  [dim]Fetching stats for {len(wallet_data)} wallets in parallel...[/dim]")
 
-    async def fetch_one(name, addr, hk_list, hk_map):
-        return (name, await get_wallet_stats(
-            client, addr, include_usd=show_usd,
-            hotkey_ss58_list=hk_list,
-            neuron_cache=neuron_cache,
-            hotkey_name_map=hk_map,
-            shared_dynamic=shared_dynamic,
-            shared_price=shared_price,
-        ))
-
-    tasks = [fetch_one(name, addr, hk_list, hk_map) for name, addr, hk_list, hk_map in wallet_data]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Each get_wallet_stats fans out further; cap how many wallets run at once
+    sem = asyncio.Semaphore(config.get("rpc_max_concurrency", DEFAULT_RPC_CONCURRENCY))
 
-    for r in results:
-        if isinstance(r, Exception):
-            print_error(f"Stats failed: {r}")
-        else:
-            all_stats.append(r)
+    async def fetch_one(name, addr, hk_list, hk_map):
+        async with sem:
+            return (name, await get_wallet_stats(
+                client, addr, include_usd=show_usd,
+                hotkey_ss58_list=hk_list,
+                neuron_cache=neuron_cache,
+                hotkey_name_map=hk_map,
+                shared_dynamic=shared_dynamic,
+                shared_price=shared_price,
+            ))
+
+    tasks = [
+        asyncio.ensure_future(fetch_one(name, addr, hk_list, hk_map))
+        for name, addr, hk_list, hk_map in wallet_data
+    ]
+
+    # Stream: all fetches run together, each wallet prints as soon as it and the
+    # ones before it are done (selection order kept, first output after the first wallet)
+    for task in tasks:
+        try:
+            name, stats = await task
+        except Exception as e:
+            print_error(f"Stats failed: {e}")
+            continue
+        display_wallet_stats(stats, wallet_name=name)
+        console.print()
+        all_stats.append((name, stats))
 
     t2 = time.time()
     console.print(f"  [dim]Stats loaded in {t2-t1:.1f}s (total {t2-t0:.1f}s)[/dim]")
 
-    if all_stats:
-        display_multi_wallet_stats(all_stats)
+    display_grand_totals(all_stats)
 
 
 async def _check_subnet_registrations(client: SubstrateClient, config: dict):
@@ -389,7 +454,6 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
 
     from bittensor_wallet import Wallet
     from core.substrate_client import rao_to_tao, decode_price
-    from core.stats import decode_ss58
     from ui.display import BLOCKS_PER_DAY
     import time
 
@@ -487,16 +551,16 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
     # Phase 5: Build final registered list with stake/emission data
     final_registered = []
     registered_hk_set = set()
+    # Price/tempo are fixed for the subnet: fold the per-row branches into two factors
+    value_factor = moving_price if moving_price > 0 else 0.0
+    # alpha RAO per tempo -> TAO per day
+    daily_factor = value_factor / tempo * BLOCKS_PER_DAY / RAO_PER_TAO if tempo > 0 else 0.0
     for wname, hk_name, hk_ss58, uid, ck_ss58, neuron in registered:
         registered_hk_set.add(hk_ss58)
         alpha_rao = coldkey_stakes.get(ck_ss58, {}).get(hk_ss58, 0)
-        alpha_tao = rao_to_tao(alpha_rao)
-        tao_value = alpha_tao * moving_price if moving_price > 0 else 0.0
-
-        emission_alpha_per_tempo = rao_to_tao(neuron.get("emission", 0))
-        emission_tao_per_tempo = emission_alpha_per_tempo * moving_price if moving_price > 0 else 0.0
-        emission_tao_per_block = emission_tao_per_tempo / tempo if tempo > 0 else 0.0
-        daily_tao = emission_tao_per_block * BLOCKS_PER_DAY
+        alpha_tao = alpha_rao / RAO_PER_TAO
+        tao_value = alpha_tao * value_factor
+        daily_tao = neuron.get("emission", 0) * daily_factor
         incentive = neuron.get("incentive", 0)
 
         final_registered.append((wname, hk_name, hk_ss58, uid, alpha_tao, tao_value, daily_tao, incentive))
@@ -508,8 +572,8 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
             continue  # already shown as registered
         alpha_rao = coldkey_stakes.get(ck_ss58, {}).get(hk_ss58, 0)
         if alpha_rao and alpha_rao > 0:
-            alpha_tao = rao_to_tao(alpha_rao)
-            tao_value = alpha_tao * moving_price if moving_price > 0 else 0.0
+            alpha_tao = alpha_rao / RAO_PER_TAO
+            tao_value = alpha_tao * value_factor
             deregistered.append((wname, hk_name, hk_ss58, alpha_tao, tao_value))
             wallet_has_reg[wname] = True  # has alpha here, not "not registered"
 
@@ -523,7 +587,7 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
 
     # Display table
     if registered:
-        table = Table(title=f"Registered on SN{netuid}", show_lines=True)
+        table = Table(title=f"Registered on SN{netuid}", show_lines=len(registered) <= SHOW_LINES_MAX_ROWS)
         table.add_column("Wallet", style="cyan")
         table.add_column("HK", style="bold white", justify="right")
         table.add_column("UID", style="yellow", justify="right")
@@ -574,7 +638,7 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
     # Deregistered hotkeys that still hold alpha
     if deregistered:
         console.print(f"\n  [bold yellow]Deregistered hotkeys still holding alpha on SN{netuid}:[/bold yellow]")
-        dtable = Table(show_lines=True)
+        dtable = Table(show_lines=len(deregistered) <= SHOW_LINES_MAX_ROWS)
         dtable.add_column("Wallet", style="cyan")
         dtable.add_column("HK", style="bold white", justify="right")
         dtable.add_column("α Stake", justify="right", style="yellow")
@@ -585,7 +649,7 @@ async def _check_subnet_registrations(client: SubstrateClient, config: dict):
 
         d_total_alpha = 0.0
         d_total_value = 0.0
-        for wname, hk_name, hk_ss58, alpha_tao, tao_value in sorted(deregistered, key=lambda x: -x[3]):
+        for wname, hk_name, hk_ss58, alpha_tao, tao_value in sorted(deregistered, key=itemgetter(3), reverse=True):
             row = [wname, hk_name, f"{alpha_tao:.4f}", f"{tao_value:.4f}"]
             if tao_price:
                 row.append(f"${tao_value * tao_price:,.2f}")
@@ -652,8 +716,7 @@ async def handle_register(client: SubstrateClient, config: dict):
     hotkey_names = hk_names
     netuid = IntPrompt.ask("Subnet ID (netuid)")
 
-    info = await get_registration_info(client, netuid)
-    tao_price = await fetch_tao_price()
+    info, tao_price = await asyncio.gather(get_registration_info(client, netuid), fetch_tao_price())
     burn_tao = info["burn_cost_tao"]
     burn_usd = f" (${burn_tao * tao_price:.4f})" if tao_price else ""
     console.print(f"\n  Burn cost: [yellow]{burn_tao:.9f} TAO{burn_usd}[/yellow]")
@@ -678,10 +741,16 @@ async def handle_register(client: SubstrateClient, config: dict):
         if not Confirm.ask(f"Register {len(hotkey_names)} hotkeys on SN{netuid}?"):
             return
 
-    wallet_obj = None
+    # One coldkey wallet for every registration (burn_register only signs with the
+    # coldkey); hotkeys are just addresses, read without building a Wallet each
+    wallet = load_wallet(w["name"], base_path=base_path)
+    unlocked = False
+    hk_ss58s = dict(load_hotkey_ss58s(w["name"], hotkey_names, base_path))
     for hk in hotkey_names:
-        wallet = load_wallet(w["name"], hk, base_path)
-        hotkey_ss58 = wallet.hotkey.ss58_address
+        hotkey_ss58 = hk_ss58s.get(hk)
+        if hotkey_ss58 is None:
+            print_error(f"Could not load hotkey {hk}")
+            continue
         console.print(f"\n  Hotkey {hk}: [dim]{hotkey_ss58}[/dim]")
 
         uid = await check_registration_status(client, hotkey_ss58, netuid)
@@ -693,15 +762,16 @@ async def handle_register(client: SubstrateClient, config: dict):
             if not Confirm.ask(f"Register on SN{netuid} for {burn_tao:.9f} TAO?"):
                 return
 
-        if wallet_obj is None:
+        if not unlocked:
             console.print("  [dim]Unlocking coldkey...[/dim]")
-            _ = wallet.coldkey
-            wallet_obj = wallet
+            await _unlock_coldkey(wallet)
+            unlocked = True
 
         console.print("  [dim]Submitting registration...[/dim]")
         success, error, uid = await burn_register(
             client, wallet, hotkey_ss58, netuid,
             limit_price_tao=limit_price_tao,
+            known_unregistered=True,
         )
         if success:
             print_success(f"Registered on SN{netuid}! UID: {uid}")
@@ -805,8 +875,7 @@ async def _swap_hotkey(client, base_path):
         return
 
     console.print("  [dim]Unlocking coldkey...[/dim]")
-    wallet = load_wallet(w["name"], old_hk_name, base_path)
-    _ = wallet.coldkey
+    wallet = await _unlock_coldkey(load_wallet(w["name"], old_hk_name, base_path))
 
     console.print("  [dim]Submitting swap_hotkey_v2...[/dim]")
     try:
@@ -847,9 +916,9 @@ async def handle_transfer(client: SubstrateClient, config: dict):
     if mode == "1":
         await _transfer_single(client, base_path)
     elif mode == "2":
-        await _transfer_batch(client, base_path)
+        await _transfer_batch(client, base_path, config.get("tx_max_concurrency", SUBMIT_CONCURRENCY))
     elif mode == "3":
-        await _transfer_collect(client, base_path)
+        await _transfer_collect(client, base_path, config.get("rpc_max_concurrency", DEFAULT_RPC_CONCURRENCY))
     elif mode == "4":
         await _transfer_collect_alpha(client, base_path)
     else:
@@ -875,7 +944,7 @@ async def _transfer_single(client, base_path):
         return
 
     console.print("  [dim]Unlocking coldkey...[/dim]")
-    _ = wallet.coldkey
+    await _unlock_coldkey(wallet)
     console.print("  [dim]Submitting transfer...[/dim]")
     success, error = await transfer_tao_keep_alive(client, wallet, dest, amount)
     if success:
@@ -884,7 +953,7 @@ async def _transfer_single(client, base_path):
         print_error(f"Transfer failed: {error}")
 
 
-async def _transfer_batch(client, base_path):
+async def _transfer_batch(client, base_path, concurrency: int = SUBMIT_CONCURRENCY):
     w = select_single_wallet(base_path, "Select source wallet")
     if not w:
         return
@@ -900,7 +969,10 @@ async def _transfer_batch(client, base_path):
 
     transfers = []  # list of (dest_ss58, amount, label)
 
-    if mode == "1":
+    if mode == "1" and not sys.stdin.isatty():
+        # Piped input: "dest,amount" lines up to a blank line or EOF, parsed without Rich prompts
+        transfers = _read_transfer_lines(sys.stdin)
+    elif mode == "1":
         console.print("  Enter destinations (empty line to finish):")
         while True:
             dest = Prompt.ask("  Dest SS58 (or empty to stop)", default="")
@@ -952,7 +1024,16 @@ async def _transfer_batch(client, base_path):
         print_warn("No transfers entered")
         return
 
-    total = sum(a for _, a, _ in transfers)
+    # One transfer per destination: repeated entries are merged (one fee, one extrinsic)
+    merged = {}  # dest -> ([amounts], label), first-entry order
+    for dest_ss58, amt, label in transfers:
+        merged.setdefault(dest_ss58, ([], label))[0].append(amt)
+    if len(merged) < len(transfers):
+        print_info(f"Merged {len(transfers) - len(merged)} repeated destination(s)")
+        transfers = [(d, math.fsum(amts), label) for d, (amts, label) in merged.items()]
+
+    # Compensated sum: no float drift across many small amounts
+    total = math.fsum(a for _, a, _ in transfers)
     console.print(f"\n  Sending to {len(transfers)} destinations:")
     for dest_ss58, amt, label in transfers:
         console.print(f"    {label:>16}: {amt:.4f} TAO")
@@ -965,7 +1046,7 @@ async def _transfer_batch(client, base_path):
         return
 
     console.print("  [dim]Unlocking coldkey...[/dim]")
-    _ = wallet.coldkey
+    await _unlock_coldkey(wallet)
 
     if mode == "2" and len(transfers) > 1:
         # Use utility.batch_all — single tx, single block
@@ -986,31 +1067,54 @@ async def _transfer_batch(client, base_path):
             print_success(f"Batch sent: {len(transfers)} transfers, {total:.4f} TAO total")
         else:
             print_error(f"Batch failed: {error}")
-            if Confirm.ask("Retry transfers one by one?"):
-                for dest_ss58, amt, label in transfers:
-                    console.print(f"  Sending {amt} TAO → {label}...")
-                    success, error = await transfer_tao_keep_alive(client, wallet, dest_ss58, amt)
-                    if success:
-                        print_success(f"Sent {amt} TAO → {label}")
-                    else:
-                        print_error(f"Failed {label}: {error}")
+            if Confirm.ask("Retry as individual transfers?"):
+                await _send_individually(client, wallet, transfers, concurrency)
     else:
-        # Sequential mode
-        ok_count = 0
-        fail_count = 0
-        for dest_ss58, amt, label in transfers:
-            console.print(f"  Sending {amt} TAO → {label}...")
-            success, error = await transfer_tao_keep_alive(client, wallet, dest_ss58, amt)
-            if success:
-                print_success(f"Sent {amt} TAO → {label}")
-                ok_count += 1
-            else:
-                print_error(f"Failed {label}: {error}")
-                fail_count += 1
-        console.print(f"\n  Done: [green]{ok_count} ok[/green], [red]{fail_count} failed[/red]")
+        await _send_individually(client, wallet, transfers, concurrency)
+
+
+def _read_transfer_lines(stream) -> list[tuple[str, float, str]]:
+    """Parse "dest,amount" lines from `stream` until a blank line or EOF. Bad lines are skipped."""
+    transfers = []
+    for line in iter(stream.readline, ""):
+        line = line.strip()
+        if not line:
+            break
+        dest, _, amount = line.partition(",")
+        dest = dest.strip()
+        try:
+            amt = float(amount)
+        except ValueError:
+            print_warn(f"Skipping '{line}': expected dest,amount")
+            continue
+        if dest and amt > 0:
+            transfers.append((dest, amt, dest[:16] + "..."))
+    return transfers
+
+
+async def _send_individually(client, wallet, transfers: list[tuple[str, float, str]], concurrency: int):
+    """
+    Separate transfer_keep_alive extrinsics from one coldkey, each succeeding on its own.
+    Pipelined: consecutive nonces, up to `concurrency` in flight, so N transfers take
+    about N / concurrency blocks. concurrency=1 sends them one at a time.
+    """
+    console.print(f"  [dim]Sending {len(transfers)} transfer(s)...[/dim]")
+    results = await transfer_tao_keep_alive_many(
+        client, wallet, [(dest_ss58, amt) for dest_ss58, amt, _ in transfers], concurrency,
+    )
+    ok_count = 0
+    fail_count = 0
+    for (dest_ss58, amt, label), (success, error) in zip(transfers, results):
+        if success:
+            print_success(f"Sent {amt} TAO → {label}")
+            ok_count += 1
+        else:
+            print_error(f"Failed {label}: {error}")
+            fail_count += 1
+    console.print(f"\n  Done: [green]{ok_count} ok[/green], [red]{fail_count} failed[/red]")
 
 
-async def _transfer_collect(client, base_path):
+async def _transfer_collect(client, base_path, concurrency: int = DEFAULT_RPC_CONCURRENCY):
     dest = Prompt.ask("Destination SS58 address")
     leave_behind = FloatPrompt.ask("TAO to leave in each wallet (for fees)", default=0.01)
 
@@ -1018,41 +1122,54 @@ async def _transfer_collect(client, base_path):
     if not selected:
         return
 
-    send_list = []
+    sources = []
     for w in selected:
         addr = get_coldkey_ss58(w["name"], base_path)
-        if not addr:
+        if addr:
+            sources.append((w, addr))
+
+    # All balances in one batched query (bounded per-address fallback inside)
+    free_by_addr = {
+        b["address"]: b["free_tao"]
+        for b in await check_all_balances(client, [addr for _, addr in sources], concurrency)
+    }
+
+    send_list = []
+    for w, addr in sources:
+        free_tao = free_by_addr.get(addr)
+        if free_tao is None:
+            print_error(f"Balance check failed for {w['name']}, skipping")
             continue
-        bal = await check_balance(client, addr)
-        available = bal["free_tao"] - leave_behind
+        available = free_tao - leave_behind
         if available > 0.0001:
             send_list.append((w, addr, available))
-            console.print(f"  {w['name']:>12}: {bal['free_tao']:.4f} TAO → send {available:.4f}")
+            console.print(f"  {w['name']:>12}: {free_tao:.4f} TAO → send {available:.4f}")
 
     if not send_list:
         print_warn("No wallets with sufficient balance")
         return
 
-    total = sum(a for _, _, a in send_list)
+    total = math.fsum(a for _, _, a in send_list)
     console.print(f"\n  Total to collect: [yellow]{total:.4f} TAO[/yellow] from {len(send_list)} wallets")
     console.print(f"  Destination: {dest}")
     if not Confirm.ask("Proceed with collect?"):
         return
 
-    # Unlock all coldkeys first
+    # Unlock all coldkeys first (password-less ones decrypt in parallel)
     console.print("  [dim]Unlocking all coldkeys...[/dim]")
-    wallet_plans = []
-    for w, addr, amount in send_list:
-        wallet = load_wallet(w["name"], base_path=base_path)
-        _ = wallet.coldkey  # unlock
-        wallet_plans.append((w["name"], wallet, amount))
+    wallets = await asyncio.gather(*[
+        _unlock_coldkey(load_wallet(w["name"], base_path=base_path)) for w, _, _ in send_list
+    ])
+    wallet_plans = [(w["name"], wallet, amount) for (w, _, amount), wallet in zip(send_list, wallets)]
 
     # Send all transfers in parallel (different coldkeys = no nonce conflict)
     console.print(f"  [dim]Sending {len(wallet_plans)} transfers in parallel...[/dim]")
+    sem = asyncio.Semaphore(concurrency)
 
     async def collect_one(name, wallet, amount):
         try:
-            success, error = await transfer_tao_keep_alive(client, wallet, dest, amount)
+            async with sem:
+                success, error = await transfer_tao_keep_alive(client, wallet, dest, amount)
             return (name, amount, success, error)
         except Exception as e:
             return (name, amount, False, str(e))
@@ -1089,8 +1206,7 @@ async def _transfer_collect(client, base_path):
     if failed_list and Confirm.ask(f"Retry {len(failed_list)} failed transfers?"):
         for name, amount, _ in failed_list:
             console.print(f"  Retrying {name}...")
-            wallet = load_wallet(name, base_path=base_path)
-            _ = wallet.coldkey
+            wallet = await _unlock_coldkey(load_wallet(name, base_path=base_path))
             success, error = await transfer_tao_keep_alive(client, wallet, dest, amount)
             if success:
                 print_success(f"Collected {amount:.4f} TAO from {name}")
@@ -1101,7 +1217,6 @@ async def _transfer_collect(client, base_path):
 async def _transfer_collect_alpha(client, base_path):
     """Collect alpha tokens from multiple wallets to one destination via move_stake + transfer_stake."""
     from core.substrate_client import tao_to_rao
-    from core.stats import decode_ss58
 
     TAOSTATS_VALIDATOR = "5GKH9FPPnWSUoeeTJp19wVtd84XqFW4pyK2ijV2GsFbhTrP1"
 
@@ -1201,12 +1316,11 @@ async def _transfer_collect_alpha(client, base_path):
 
     # Unlock all source coldkeys
     console.print("  [dim]Unlocking all coldkeys...[/dim]")
-    wallet_cache = {}  # name -> wallet (unlocked)
-    for name, _, _, _, _ in collect_plan:
-        if name not in wallet_cache:
-            wallet = load_wallet(name, base_path=base_path)
-            _ = wallet.coldkey  # unlock
-            wallet_cache[name] = wallet
+    names = list(dict.fromkeys(name for name, _, _, _, _ in collect_plan))
+    unlocked = await asyncio.gather(*[
+        _unlock_coldkey(load_wallet(name, base_path=base_path)) for name in names
+    ])
+    wallet_cache = dict(zip(names, unlocked))  # name -> wallet (unlocked)
 
     # Group by wallet for batching
     # For each source coldkey, build batch: move_stake(s) + transfer_stake(s)
@@ -1302,7 +1416,6 @@ async def _transfer_collect_alpha(client, base_path):
 async def _transfer_distribute_alpha(client, base_path):
     """Distribute alpha from one source wallet to multiple destination wallets via transfer_stake."""
     from core.substrate_client import tao_to_rao, rao_to_tao
-    from core.stats import decode_ss58
 
     TAOSTATS_VALIDATOR = "5GKH9FPPnWSUoeeTJp19wVtd84XqFW4pyK2ijV2GsFbhTrP1"
 
@@ -1491,8 +1604,7 @@ async def _transfer_distribute_alpha(client, base_path):
     # All calls go into one batch_all since it's one source coldkey.
 
     console.print("  [dim]Unlocking source coldkey...[/dim]")
-    src_wallet = load_wallet(src_w["name"], base_path=base_path)
-    _ = src_wallet.coldkey
+    src_wallet = await _unlock_coldkey(load_wallet(src_w["name"], base_path=base_path))
 
     # For each dest, we need alpha on the dest_hotkey first.
     # If source has alpha on a different hotkey, we move_stake first.
@@ -1790,7 +1902,7 @@ async def handle_add_stake(client: SubstrateClient, config: dict):
         return
 
     console.print("  [dim]Unlocking coldkey...[/dim]")
-    _ = wallet.coldkey
+    await _unlock_coldkey(wallet)
 
     console.print("  [dim]Submitting...[/dim]")
     success, error = await add_stake(
@@ -1855,33 +1967,37 @@ async def handle_unstake(client: SubstrateClient, config: dict):
         if not selected:
             return
 
-        # First pass: find all staked hotkeys across all selected wallets
-        unstake_plan = []  # list of (wallet_dict, addr, staked_hotkeys_set)
+        # First pass: find all staked hotkeys across all selected wallets (queried concurrently)
+        sources = []
         for w in selected:
             addr = get_coldkey_ss58(w["name"], base_path)
-            if not addr:
+            if addr:
+                sources.append((w, addr))
+            else:
                 print_warn(f"Could not load address for {w['name']}")
-                continue
 
-            console.print(f"  [dim]Checking {w['name']}...[/dim]")
-            try:
-                stake_entries = await client.get_stake_info_for_coldkey(addr)
-            except Exception as e:
-                print_error(f"Failed to query stakes for {w['name']}: {e}")
-                continue
+        console.print(f"  [dim]Checking {len(sources)} wallets...[/dim]")
+        sem = asyncio.Semaphore(config.get("rpc_max_concurrency", DEFAULT_RPC_CONCURRENCY))
+
+        async def scan(addr):
+            async with sem:
+                return await rpc_cache.stake_info(client, addr)
 
+        scans = await asyncio.gather(*[scan(addr) for _, addr in sources], return_exceptions=True)
+
+        unstake_plan = []  # list of (wallet_dict, addr, staked_hotkeys_frozenset)
+        for (w, addr), stake_entries in zip(sources, scans):
+            if isinstance(stake_entries, Exception):
+                print_error(f"Failed to query stakes for {w['name']}: {stake_entries}")
+                continue
             if not stake_entries:
                 continue
 
-            from core.stats import decode_ss58
-            staked_hotkeys = set()
-            for entry in stake_entries:
-                if isinstance(entry, dict):
-                    stake = entry.get("stake", 0)
-                    if stake and stake > 0:
-                        hk = decode_ss58(entry.get("hotkey", ""))
-                        if hk:
-                            staked_hotkeys.add(hk)
+            staked_hotkeys = frozenset(
+                hk for entry in stake_entries
+                if isinstance(entry, dict) and (entry.get("stake") or 0) > 0
+                and (hk := decode_ss58(entry.get("hotkey", "")))
+            )
 
             if staked_hotkeys:
                 unstake_plan.append((w, addr, staked_hotkeys))
@@ -1910,9 +2026,8 @@ async def handle_unstake(client: SubstrateClient, config: dict):
             # Sequential: one by one
             for w, addr, staked_hotkeys in unstake_plan:
                 console.print(f"\n  [cyan]{w['name']}[/cyan] ({len(staked_hotkeys)} hotkeys)")
-                wallet = load_wallet(w["name"], base_path=base_path)
                 console.print("  [dim]Unlocking coldkey...[/dim]")
-                _ = wallet.coldkey
+                wallet = await _unlock_coldkey(load_wallet(w["name"], base_path=base_path))
 
                 for hk_ss58 in staked_hotkeys:
                     console.print(f"  Unstaking {hk_ss58[:16]}...")
@@ -1928,11 +2043,13 @@ async def handle_unstake(client: SubstrateClient, config: dict):
             # Parallel: different coldkeys run concurrently
             # Hotkeys within same coldkey stay sequential (same nonce source)
             console.print("\n  [dim]Unlocking all coldkeys...[/dim]")
-            wallet_plans = []
-            for w, addr, staked_hotkeys in unstake_plan:
-                wallet = load_wallet(w["name"], base_path=base_path)
-                _ = wallet.coldkey  # unlock
-                wallet_plans.append((w["name"], wallet, list(staked_hotkeys)))
+            wallets = await asyncio.gather(*[
+                _unlock_coldkey(load_wallet(w["name"], base_path=base_path)) for w, _, _ in unstake_plan
+            ])
+            wallet_plans = [
+                (w["name"], wallet, list(staked_hotkeys))
+                for (w, _, staked_hotkeys), wallet in zip(unstake_plan, wallets)
+            ]
 
             console.print(f"  [dim]Starting parallel unstake ({total_wallets} wallets)...[/dim]")
 
@@ -1981,12 +2098,11 @@ async def handle_unstake(client: SubstrateClient, config: dict):
 
         console.print(f"  [dim]Scanning stakes on SN{netuid}...[/dim]")
         try:
-            stakes = await client.get_stake_info_for_coldkey(addr)
+            stakes = await rpc_cache.stake_info(client, addr)
         except Exception as e:
             print_error(f"Failed to get stakes: {e}")
             return
 
-        from core.stats import decode_ss58
         from core.substrate_client import rao_to_tao
 
         staked_hotkeys = []  # list of (hotkey_ss58, alpha_rao, alpha_tao)
@@ -2015,7 +2131,7 @@ async def handle_unstake(client: SubstrateClient, config: dict):
 
         console.print("  [dim]Unlocking coldkey...[/dim]")
         wallet = load_wallet(w["name"], base_path=base_path)
-        _ = wallet.coldkey
+        await _unlock_coldkey(wallet)
 
         for hk_ss58, alpha_rao, alpha_tao in staked_hotkeys:
             console.print(f"  Unstaking {alpha_tao:.4f} from HK {hk_ss58[:16]}...")
@@ -2049,7 +2165,7 @@ async def handle_unstake(client: SubstrateClient, config: dict):
         if not Confirm.ask(f"Unstake {amount} alpha from SN{netuid}?"):
             return
         console.print("  [dim]Unlocking coldkey...[/dim]")
-        _ = wallet.coldkey
+        await _unlock_coldkey(wallet)
         success, error = await remove_stake(client, wallet, hotkey_ss58, netuid, amount)
         if success:
             print_success(f"Unstaked {amount} alpha from SN{netuid}")
@@ -2067,7 +2183,6 @@ async def handle_unstake(client: SubstrateClient, config: dict):
 
         # Scan all wallets for stake on this subnet
         console.print(f"  [dim]Scanning stakes on SN{netuid}...[/dim]")
-        from core.stats import decode_ss58
         from core.substrate_client import rao_to_tao, tao_to_rao
 
         unstake_plan = []  # list of (wallet_dict, coldkey_ss58, [(hotkey_ss58, unstake_rao, unstake_tao)])
@@ -2077,7 +2192,7 @@ async def handle_unstake(client: SubstrateClient, config: dict):
                 continue
 
             try:
-                stakes = await client.get_stake_info_for_coldkey(addr)
+                stakes = await rpc_cache.stake_info(client, addr)
             except Exception as e:
                 print_error(f"Failed to get stakes for {w['name']}: {e}")
                 continue
@@ -2140,11 +2255,13 @@ async def handle_unstake(client: SubstrateClient, config: dict):
 
         # Unlock all coldkeys
         console.print("  [dim]Unlocking all coldkeys...[/dim]")
-        wallet_plans = []
-        for w, addr, hotkey_unstakes in unstake_plan:
-            wallet = load_wallet(w["name"], base_path=base_path)
-            _ = wallet.coldkey
-            wallet_plans.append((w["name"], wallet, hotkey_unstakes))
+        wallets = await asyncio.gather(*[
+            _unlock_coldkey(load_wallet(w["name"], base_path=base_path)) for w, _, _ in unstake_plan
+        ])
+        wallet_plans = [
+            (w["name"], wallet, hotkey_unstakes)
+            for (w, _, hotkey_unstakes), wallet in zip(unstake_plan, wallets)
+        ]
 
         # Process in parallel
         async def unstake_wallet(name, wallet, hotkey_unstakes):
@@ -2218,7 +2335,6 @@ async def handle_subnet_info(client: SubstrateClient, config: dict):
 
 async def _pruning_prediction(client, config, netuid, top_n=30):
     """Predict which UIDs will be pruned next on a subnet."""
-    from core.stats import decode_ss58
 
     def cv(v):
         """Extract value from Compact dict or return as-is."""
@@ -2227,7 +2343,7 @@ async def _pruning_prediction(client, config, netuid, top_n=30):
         return v if v is not None else 0
 
     console.print(f"  [dim]Fetching metagraph for SN{netuid}...[/dim]")
-    metagraph = await client.get_metagraph(netuid)
+    metagraph = await client.get_metagraph_fields(netuid, FIELDS_PRUNING)
     if not metagraph:
         print_error(f"Could not fetch metagraph for SN{netuid}")
         return
@@ -2282,7 +2398,7 @@ async def _pruning_prediction(client, config, netuid, top_n=30):
             if str(ck) == str(owner_coldkey):
                 rb = block_at_reg[uid] if uid < len(block_at_reg) else 0
                 owner_uids.append((rb, uid))
-    owner_uids.sort(key=lambda x: (x[0], x[1]))
+    owner_uids.sort()  # (block_at_reg, uid) pairs
     immune_owner_uids = set(uid for _, uid in owner_uids[:immune_owner_limit])
 
     # Add subnet owner hotkey UID
@@ -2371,7 +2487,7 @@ async def _pruning_prediction(client, config, netuid, top_n=30):
     # Display table
     if prune_order:
         show_n = min(top_n, len(prune_order))
-        table = Table(title=f"Top {show_n} UIDs at risk — SN{netuid}", show_lines=True)
+        table = Table(title=f"Top {show_n} UIDs at risk — SN{netuid}", show_lines=show_n <= SHOW_LINES_MAX_ROWS)
         table.add_column("#", style="dim", justify="right")
         table.add_column("UID", style="cyan", justify="right")
         table.add_column("Emission", justify="right")
@@ -2418,7 +2534,6 @@ async def _pruning_prediction(client, config, netuid, top_n=30):
 
 async def _weights_analysis(client, config, netuid, num_epochs=1):
     """Analyze validator weights on a subnet, optionally across epochs."""
-    from core.stats import decode_ss58
     from async_substrate_interface import AsyncSubstrateInterface
 
     ARCHIVE_URL = "wss://archive.chain.opentensor.ai:443"
@@ -2446,7 +2561,7 @@ async def _weights_analysis(client, config, netuid, num_epochs=1):
         return weights
 
     console.print(f"  [dim]Fetching metagraph for SN{netuid}...[/dim]")
-    meta = await client.get_metagraph(netuid)
+    meta = await client.get_metagraph_fields(netuid, FIELDS_EPOCH)
     if not meta:
         print_error(f"Could not fetch metagraph for SN{netuid}")
         return
@@ -2515,7 +2630,7 @@ async def _weights_analysis(client, config, netuid, num_epochs=1):
             w_list = weights[vuid]
             if not w_list:
                 continue
-            sorted_w = sorted(w_list, key=lambda x: x[1], reverse=True)
+            sorted_w = sorted(w_list, key=itemgetter(1), reverse=True)
             vhk = hk_list[vuid][:12] if vuid < len(hk_list) else "?"
             entries = []
             for target, weight in sorted_w:
@@ -2703,38 +2818,46 @@ async def handle_wallet_groups(config: dict):
 # Main loop
 # ========================================================================
 
+# choice -> (handler, needs_client); handlers take (client, config) or just (config)
 HANDLERS = {
-    "1": handle_create_wallet,
-    "2": handle_check_balances,
-    "3": handle_wallet_stats,
-    "4": handle_register,
-    "5": handle_transfer,
-    "6": handle_unstake,
-    "7": handle_subnet_info,
-    "8": handle_wallet_groups,
-    "9": handle_add_stake,
+    "1": (handle_create_wallet, False),
+    "2": (handle_check_balances, True),
+    "3": (handle_wallet_stats, True),
+    "4": (handle_register, True),
+    "5": (handle_transfer, True),
+    "6": (handle_unstake, True),
+    "7": (handle_subnet_info, True),
+    "8": (handle_wallet_groups, False),
+    "9": (handle_add_stake, True),
 }
 
 
 async def main_menu_loop(client: SubstrateClient, config: dict):
+    # client and config are fixed for the session: bind each handler's arguments once
+    bound = {
+        key: partial(handler, client, config) if needs_client else partial(handler, config)
+        for key, (handler, needs_client) in HANDLERS.items()
+    }
     while True:
         show_main_menu()
         choice = Prompt.ask("Select option", default="0")
         if choice == "0":
             console.print("\n  [dim]Goodbye![/dim]\n")
             break
-        handler = HANDLERS.get(choice)
+        handler = bound.get(choice)
         if handler:
             try:
-                if choice in ("1", "8"):
-                    await handler(config)
-                else:
-                    await handler(client, config)  # all others take (client, config)
+                await handler()
             except KeyboardInterrupt:
                 console.print("\n  [dim]Cancelled[/dim]")
             except Exception as e:
                 print_error(f"Error: {e}")
-                import traceback
-                traceback.print_exc()
+                # INFO, not exception(): the console handler echoes WARNING+ to stderr.
+                # Flushed now so the traceback survives a later crash.
+                logger.info(f"Menu option {choice} failed", exc_info=True)
+                flush_logs()
+                # Full traceback on screen only in debug mode
+                if config.get("debug"):
+                    traceback.print_exc()
         else:
             print_warn("Invalid option")
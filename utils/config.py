@@ -1,16 +1,34 @@
+import copy
 import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
 
+# libyaml-backed parser when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def load_config(path: str = "config.yaml") -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file. Re-parsed only when the file changes."""
     config_path = Path(path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+
+    # Callers may mutate the result; keep the cached copy pristine
+    return copy.deepcopy(_load_cached(str(config_path.resolve()), mtime_ns))
+
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+@lru_cache(maxsize=8)
+def _load_cached(abs_path: str, mtime_ns: int) -> dict:
+    """Parse one version (path, mtime) of a config file."""
+    # Binary: the loader detects the encoding itself
+    with open(abs_path, "rb") as f:
+        config = yaml.load(f, Loader=_Loader)
 
     # Expand ~ in wallet base_path
     if "wallet" in config and "base_path" in config["wallet"]:
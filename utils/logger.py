@@ -1,7 +1,49 @@
 import logging
 import os
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
+LOG_BUFFER_RECORDS = 512  # INFO records held in memory before one batched write
+LOG_MAX_BYTES = 10 * 1024 * 1024  # rotate the log file at this size
+LOG_BACKUP_COUNT = 5  # rotated files kept (btmanager.log.1 ... .5)
+
+# One buffered file handler per log file, shared by all module loggers so records stay in order
+_FILE_HANDLERS: dict[str, logging.Handler] = {}
+
+
+def _file_handler(log_file: str, level) -> logging.Handler:
+    """
+    Buffered, size-rotated handler for `log_file`: records are written in batches,
+    and WARNING+ flushes immediately. logging.shutdown() flushes the rest at exit.
+    """
+    handler = _FILE_HANDLERS.get(log_file)
+    if handler is None:
+        # delay: the file is opened on the first write, not at import
+        fh = RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8", delay=True,
+        )
+        fh.setLevel(level)
+        fh.setFormatter(logging.Formatter(
+            "%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+        handler = MemoryHandler(
+            capacity=LOG_BUFFER_RECORDS,
+            flushLevel=logging.WARNING,
+            target=fh,
+            flushOnClose=True,
+        )
+        handler.setLevel(level)
+        _FILE_HANDLERS[log_file] = handler
+    return handler
+
+
+def flush_logs() -> None:
+    """Write out buffered records now, e.g. a traceback that must not wait for the buffer to fill."""
+    for handler in _FILE_HANDLERS.values():
+        handler.flush()
+
 
 def setup_logger(name: str, log_file: str = "logs/btmanager.log", level=logging.INFO) -> logging.Logger:
     """Setup logger with file and console handlers."""
@@ -12,14 +54,8 @@ def setup_logger(name: str, log_file: str = "logs/btmanager.log", level=logging.
     logger.setLevel(level)
 
     if not logger.handlers:
-        # File handler
-        fh = logging.FileHandler(log_file)
-        fh.setLevel(level)
-        fh.setFormatter(logging.Formatter(
-            "%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        ))
-        logger.addHandler(fh)
+        # File handler (buffered)
+        logger.addHandler(_file_handler(log_file, level))
 
         # Console handler (only warnings+)
         ch = logging.StreamHandler()
@@ -0,0 +1,34 @@
+"""
+Client-side rate limiting for RPC reads.
+Public endpoints answer bursts of concurrent queries with 429s or dropped
+connections; a token bucket keeps fan-outs under the provider's limit.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """`rate` acquisitions per second on average, up to `burst` at once. Waiters are served FIFO."""
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                # Lock held while sleeping: later callers queue behind this one
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
@@ -0,0 +1,146 @@
+"""
+Short-lived cache for read-only chain queries.
+Entries hold the in-flight task, so concurrent callers share one RPC
+instead of each hitting the node. Failed calls are never cached: the
+wrapped client methods run with strict=True so a failed read raises and
+is evicted, instead of caching the client's fallback value.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Hashable, Optional
+
+# Roughly one block: values are reused within a single command run
+BLOCK_TTL = 6.0
+# Subnet hyperparameters only change by owner/sudo calls
+HYPERPARAMS_TTL = 30.0
+# Stake positions across repeated unstake menu runs; our own extrinsics clear it
+STAKE_TTL = 30.0
+
+# Cached reads our own extrinsics can change (stake, transfer, registration).
+# Prices, hyperparameters and the neuron cache are left alone.
+EXTRINSIC_AFFECTED = ("stake_info", "all_dynamic_info", "burn_cost", "subnet_size")
+
+# key -> (expires_at, task)
+_cache: dict[Hashable, tuple[float, asyncio.Future]] = {}
+
+
+def _drop_if_failed(key: Hashable, task: asyncio.Future) -> None:
+    """Done-callback: evict the entry if the call raised or was cancelled."""
+    failed = task.cancelled() or task.exception() is not None
+    entry = _cache.get(key)
+    if failed and entry is not None and entry[1] is task:
+        del _cache[key]
+
+
+async def cached_call(key: Hashable, ttl_seconds: float, coro_factory):
+    """
+    Return the cached result for `key`, or run coro_factory() and cache it.
+    Callers arriving while the first call is still running await the same task.
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is None or entry[0] <= now:
+        task = asyncio.ensure_future(coro_factory())
+        task.add_done_callback(functools.partial(_drop_if_failed, key))
+        entry = (now + ttl_seconds, task)
+        _cache[key] = entry
+    # shield: one cancelled caller must not cancel the shared call
+    return await asyncio.shield(entry[1])
+
+
+# key -> task, only while the call is running (no caching of the result)
+_inflight: dict[Hashable, asyncio.Future] = {}
+
+
+async def coalesced_call(key: Hashable, coro_factory):
+    """
+    Share one in-flight call between concurrent callers with the same key.
+    Nothing is kept once it finishes, so use it for values that must be fresh
+    (balances) where a TTL cache would hand out stale results.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _inflight.pop(key) if _inflight.get(key) is t else None)
+    return await asyncio.shield(task)
+
+
+def async_ttl_cache(ttl_seconds: float, fallback=None):
+    """
+    Decorator for async functions. Keys on (function name, *args).
+    All positional args must be hashable (client objects hash by identity).
+    With a fallback factory, a failed call returns fallback() (uncached)
+    instead of raising.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args):
+            try:
+                return await cached_call((fn.__name__, *args), ttl_seconds, lambda: fn(*args))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if fallback is None:
+                    raise
+                return fallback()
+        return wrapper
+    return decorator
+
+
+def peek(key: Hashable):
+    """Cached result for `key` if it is fresh and already resolved, else None. Never starts a call."""
+    entry = _cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    task = entry[1]
+    if not task.done() or task.cancelled() or task.exception() is not None:
+        return None
+    return task.result()
+
+
+def invalidate(name: Optional[str] = None) -> None:
+    """Drop cached entries for one cached function name, or everything."""
+    if name is None:
+        _cache.clear()
+        return
+    for key in [k for k in _cache if isinstance(k, tuple) and k and k[0] == name]:
+        del _cache[key]
+
+
+# ============================================================================
+# Cached chain reads shared by core modules
+# ============================================================================
+
+# Fallbacks match what the uncached client methods return on failure
+
+@async_ttl_cache(BLOCK_TTL, fallback=int)
+async def burn_cost(client, netuid: int) -> int:
+    return await client.get_burn_cost(netuid, strict=True)
+
+
+@async_ttl_cache(HYPERPARAMS_TTL, fallback=lambda: None)
+async def subnet_hyperparams(client, netuid: int) -> Optional[dict]:
+    return await client.get_subnet_hyperparams(netuid, strict=True)
+
+
+@async_ttl_cache(BLOCK_TTL, fallback=lambda: None)
+async def subnet_size(client, netuid: int) -> Optional[tuple]:
+    return await client.get_subnet_size(netuid, strict=True)
+
+
+@async_ttl_cache(BLOCK_TTL, fallback=list)
+async def all_dynamic_info(client) -> list:
+    return await client.get_all_dynamic_info(strict=True)
+
+
+async def balance(client, ss58_address: str) -> int:
+    return await coalesced_call(("balance", client, ss58_address), lambda: client.get_balance(ss58_address))
+
+
+# No fallback: every caller reports a failed stake scan instead of showing no stake
+@async_ttl_cache(STAKE_TTL)
+async def stake_info(client, coldkey_ss58: str) -> list:
+    return await client.get_stake_info_for_coldkey(coldkey_ss58, strict=True)